@@ -75,6 +75,10 @@ class TradingConfig(BaseSettings):
     api_weight_limit: int = 2400
     api_weight_window_sec: int = 60
 
+    # ── Process ──────────────────────────────────────────────────
+    # Comma-separated CPU ids to pin the process to, e.g. "2,3" (Linux)
+    cpu_affinity: str = Field(default="", alias="CPU_AFFINITY")
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
     @property
@@ -32,6 +32,30 @@ def calc_ema(prices: np.ndarray, period: int) -> float:
     return result
 
 
+@njit(cache=True)
+def calc_ema3(prices: np.ndarray, fast: int, medium: int,
+              trend: int) -> tuple[float, float, float]:
+    """Three EMAs in one pass over `prices` — same values as calc_ema ×3. Numba JIT."""
+    n = len(prices)
+    if n == 0:
+        return (0.0, 0.0, 0.0)
+    last = prices[-1]
+    kf = 2.0 / (fast + 1)
+    km = 2.0 / (medium + 1)
+    kt = 2.0 / (trend + 1)
+    ef = prices[0]
+    em = prices[0]
+    et = prices[0]
+    for i in range(1, n):
+        p = prices[i]
+        ef = p * kf + ef * (1.0 - kf)
+        em = p * km + em * (1.0 - km)
+        et = p * kt + et * (1.0 - kt)
+    return (ef if n >= fast else last,
+            em if n >= medium else last,
+            et if n >= trend else last)
+
+
 @njit(cache=True)
 def calc_rsi(prices: np.ndarray, period: int) -> float:
     """RSI — Wilder's smoothing (Numba JIT)."""
@@ -161,6 +185,57 @@ def detect_squeeze(closes: np.ndarray, bb_period: int,
     return percentile < 0.15
 
 
+@njit(cache=True)
+def calc_bandwidth(closes: np.ndarray, period: int, num_std: float) -> float:
+    """BB bandwidth of the last `period` closes (NaN if mid <= 0). Numba JIT."""
+    n = len(closes)
+    start = n - period
+    total = 0.0
+    for j in range(start, n):
+        total += closes[j]
+    mid = total / period
+    if mid <= 0:
+        return np.nan
+    sq_sum = 0.0
+    for j in range(start, n):
+        diff = closes[j] - mid
+        sq_sum += diff * diff
+    std = (sq_sum / (period - 1)) ** 0.5
+    return (2.0 * num_std * std) / mid
+
+
+@njit(cache=True)
+def squeeze_from_bandwidths(bandwidths: np.ndarray, lookback: int) -> bool:
+    """
+    BB Squeeze from memoized per-bar bandwidths (oldest → newest).
+    Same rule as detect_squeeze, without recomputing past windows. Numba JIT.
+    """
+    n = len(bandwidths)
+    if n < lookback:
+        return False
+
+    min_bw = 1e18
+    max_bw = -1e18
+    current_bw = 0.0
+
+    for offset in range(lookback):
+        bw = bandwidths[n - 1 - offset]
+        if np.isnan(bw):
+            continue
+        if offset == 0:
+            current_bw = bw
+        if bw < min_bw:
+            min_bw = bw
+        if bw > max_bw:
+            max_bw = bw
+
+    bw_range = max_bw - min_bw
+    if bw_range <= 0:
+        return False
+    percentile = (current_bw - min_bw) / bw_range
+    return percentile < 0.15
+
+
 @njit(cache=True)
 def calc_vwap(closes: np.ndarray, volumes: np.ndarray,
               period: int) -> float:
@@ -194,6 +269,19 @@ def calc_rvol(volumes: np.ndarray, period: int) -> float:
     return current / avg
 
 
+@njit(cache=True)
+def atr_percentile_rank(atr_history: np.ndarray, window: int) -> float:
+    """Share of the last `window` ATRs strictly below the latest. Numba JIT."""
+    n = len(atr_history)
+    start = n - window if n > window else 0
+    current = atr_history[n - 1]
+    below = 0
+    for i in range(start, n):
+        if atr_history[i] < current:
+            below += 1
+    return below / (n - start)
+
+
 @njit(cache=True)
 def order_book_imbalance(bid_qty: float, ask_qty: float) -> float:
     """OBI: -1.0 (sell pressure) to +1.0 (buy pressure)."""
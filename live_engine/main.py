@@ -5,27 +5,74 @@ Orchestrates all subsystems: WS → SignalEngine → OMS → Risk → Execution.
 
 import asyncio
 import logging
+import logging.handlers
+import os
+import queue
 import signal
+import sys
 import time
 import uuid
 
-try:
-    import uvloop
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-except ImportError:
-    pass  # Windows: use default asyncio
-
 from .config import TradingConfig
 from .ws_manager import BinanceWSManager
 from .signal_engine import SignalEngine, VolumeBarAggregator, MarketRegime
 from .oms import OrderMonitor, ManagedOrder, RateLimitManager
 from .risk import CircuitBreaker, dynamic_position_size
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-    datefmt="%H:%M:%S",
-)
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that re-renders %(asctime)s only when the second changes."""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_sec = -1
+        self._cached_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        if not datefmt:
+            return super().formatTime(record, datefmt)  # includes msecs
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_str = super().formatTime(record, datefmt)
+        return self._cached_str
+
+
+class _OverflowQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the event loop on a full queue.
+
+    Below WARNING the record is dropped; WARNING and above are written
+    straight to `fallback` so halts and errors are never lost.
+    """
+
+    def __init__(self, log_queue, fallback: logging.Handler):
+        super().__init__(log_queue)
+        self.fallback = fallback
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                self.fallback.handle(record)
+
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Route logging through a queue; stream I/O runs on the listener thread."""
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_CachedTimeFormatter(
+        "%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+        datefmt="%H:%M:%S",
+    ))
+    log_queue: queue.Queue = queue.Queue(maxsize=10_000)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    queue_handler = _OverflowQueueHandler(log_queue, stream_handler)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # layout applied by stream_handler
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    listener.start()
+    return listener
+
+
 logger = logging.getLogger("main")
 
 
@@ -36,6 +83,7 @@ class LiveTradingSystem:
         self.cfg = config
         self.event_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
         self.shutdown_event = asyncio.Event()
+        self._shutdown_waiter: asyncio.Future | None = None
 
         # Subsystems
         self.ws_manager = BinanceWSManager(config, self.event_queue)
@@ -55,14 +103,20 @@ class LiveTradingSystem:
         )
 
         # Per-symbol setup
+        self._pipelines: dict[str, tuple[VolumeBarAggregator, SignalEngine]] = {}
         for symbol in config.trading_pairs:
             self.signal_engines[symbol] = SignalEngine(config)
             self.bar_aggregators[symbol] = VolumeBarAggregator(
                 threshold_usd=config.volume_bar_threshold_usd
             )
+            # One lookup per trade instead of two
+            self._pipelines[symbol] = (
+                self.bar_aggregators[symbol], self.signal_engines[symbol]
+            )
 
         # Cooldown tracking per symbol
         self._last_trade_ts: dict[str, float] = {}
+        self._skip_log_ts: dict[str, float] = {}
         self._balance: float = 0.0
 
     async def run(self):
@@ -71,75 +125,89 @@ class LiveTradingSystem:
         logger.info("  Directional Scalping System — LIVE")
         logger.info(f"  Pairs: {self.cfg.trading_pairs}")
         logger.info(f"  Testnet: {self.cfg.binance_use_testnet}")
+        logger.info(f"  Event loop: {type(asyncio.get_running_loop()).__module__}")
         logger.info("=" * 60)
 
-        tasks = [
-            asyncio.create_task(
-                self.ws_manager.run_market_stream(), name="market_ws"
-            ),
-            asyncio.create_task(
-                self.ws_manager.run_user_stream(), name="user_ws"
-            ),
-            asyncio.create_task(
-                self._event_dispatcher(), name="dispatcher"
-            ),
-            asyncio.create_task(
-                self._orphan_checker(), name="orphan_check"
-            ),
-            asyncio.create_task(
-                self._daily_reset_scheduler(), name="daily_reset"
-            ),
-        ]
+        # Python 3.12+: run new tasks inline until their first real suspension
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory"):
+            loop.set_task_factory(asyncio.eager_task_factory)
+
+        services = (
+            (self.ws_manager.run_market_stream(), "market_ws"),
+            (self.ws_manager.run_user_stream(), "user_ws"),
+            (self._event_dispatcher(), "dispatcher"),
+            (self._orphan_checker(), "orphan_check"),
+            (self._daily_reset_scheduler(), "daily_reset"),
+        )
 
         # Graceful shutdown on SIGINT/SIGTERM
-        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             try:
                 loop.add_signal_handler(sig, self.shutdown_event.set)
             except NotImplementedError:
                 pass  # Windows doesn't support add_signal_handler
 
-        logger.info("All tasks started. Waiting for shutdown signal...")
-        await self.shutdown_event.wait()
-
-        logger.info("Shutting down...")
-        await self.ws_manager.stop()
-        for t in tasks:
-            t.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if hasattr(asyncio, "TaskGroup"):
+            # 3.11+: the group awaits every task on exit, and a crashed
+            # service cancels the rest instead of leaving a half-running bot
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(coro, name=name)
+                         for coro, name in services]
+                await self._wait_for_shutdown(tasks)
+        else:
+            tasks = [asyncio.create_task(coro, name=name)
+                     for coro, name in services]
+            await self._wait_for_shutdown(tasks)
+            await asyncio.gather(*tasks, return_exceptions=True)
         logger.info("Shutdown complete.")
 
+    async def _wait_for_shutdown(self, tasks: list[asyncio.Task]):
+        """Block until shutdown is signalled, then stop streams and cancel tasks."""
+        logger.info("All tasks started. Waiting for shutdown signal...")
+        try:
+            await self.shutdown_event.wait()
+        finally:
+            logger.info("Shutting down...")
+            await self.ws_manager.stop()
+            for t in tasks:
+                t.cancel()
+
     # ─────────────────────────────────────────────────────────────
     # Event Dispatcher (single consumer for all events)
     # ─────────────────────────────────────────────────────────────
 
     async def _event_dispatcher(self):
-        """Main event loop — processes all events from the queue."""
-        while not self.shutdown_event.is_set():
-            try:
-                event = await asyncio.wait_for(
-                    self.event_queue.get(), timeout=1.0
-                )
-            except asyncio.TimeoutError:
-                continue
-
-            etype = event.get("type")
-
-            if etype == "agg_trade":
-                await self._on_agg_trade(event)
-            elif etype == "book_ticker":
-                self._on_book_ticker(event)
-            elif etype == "order_update":
-                self.oms.on_user_data_update(event["data"])
-            elif etype == "account_update":
-                self._on_account_update(event["data"])
+        """Main event loop — processes all events until cancelled by run()."""
+        queue = self.event_queue
+        while True:
+            # Plain get(): no timeout wrapper per wake-up; shutdown cancels us
+            event = await queue.get()
+
+            # Drain the rest of the burst before awaiting again
+            while True:
+                await self._dispatch(event)
+                try:
+                    event = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+    async def _dispatch(self, event: dict):
+        etype = event.get("type")
+
+        if etype == "agg_trade":
+            await self._on_agg_trade(event)
+        elif etype == "order_update":
+            self.oms.on_user_data_update(event["data"])
+        elif etype == "account_update":
+            self._on_account_update(event["data"])
 
     async def _on_agg_trade(self, event: dict):
         symbol = event["symbol"]
-        agg = self.bar_aggregators.get(symbol)
-        engine = self.signal_engines.get(symbol)
-        if not agg or not engine:
+        pipeline = self._pipelines.get(symbol)
+        if pipeline is None:
             return
+        agg, engine = pipeline
 
         # Aggregate into volume bar
         bar = agg.on_trade(
@@ -151,20 +219,35 @@ class LiveTradingSystem:
         if bar is None:
             return  # Bar not yet complete
 
+        # OBI from the freshest top-of-book at bar close
+        top = self.ws_manager.book_tops.get(symbol)
+        if top is not None:
+            engine.update_obi(top[1], top[3])
+
         # Process completed volume bar through signal engine
         sig = engine.on_volume_bar(bar)
         if sig is None:
             return
 
+        cfg = self.cfg
+        now = time.monotonic()  # one clock read for skip-log, cooldown, stamp
+
+        # No balance snapshot yet (or wallet empty) → sizing would yield 0
+        if self._balance <= 0:
+            if now - self._skip_log_ts.get(symbol, 0.0) >= 10.0:
+                self._skip_log_ts[symbol] = now
+                logger.info("[SKIP] %s %s: no balance yet", symbol, sig.type.name)
+            return
+
         # Circuit breaker check
         can_trade, reason = self.circuit_breaker.check()
         if not can_trade:
-            logger.warning(f"[CB] Blocked signal {sig.type.name}: {reason}")
+            logger.warning("[CB] Blocked signal %s: %s", sig.type.name, reason)
             return
 
         # Cooldown check
         last_ts = self._last_trade_ts.get(symbol, 0)
-        if time.monotonic() - last_ts < self.cfg.cooldown_bars * 0.5:
+        if now - last_ts < cfg.cooldown_bars * 0.5:
             return  # Still in cooldown
 
         # Position sizing
@@ -172,10 +255,10 @@ class LiveTradingSystem:
             balance=self._balance,
             atr=sig.atr,
             price=bar.close,
-            risk_pct=self.cfg.risk_per_trade_pct,
-            sl_atr_mult=self.cfg.atr_sl_multiplier,
-            max_position_pct=self.cfg.max_position_pct,
-            leverage=self.cfg.leverage,
+            risk_pct=cfg.risk_per_trade_pct,
+            sl_atr_mult=cfg.atr_sl_multiplier,
+            max_position_pct=cfg.max_position_pct,
+            leverage=cfg.leverage,
         )
         if sig.regime == MarketRegime.VOLATILE:
             qty *= 0.5  # Reduce size in volatile regime
@@ -197,66 +280,113 @@ class LiveTradingSystem:
             },
         )
         self.oms.on_order_submitted(order)
-        self._last_trade_ts[symbol] = time.monotonic()
+        self._last_trade_ts[symbol] = now
 
         logger.info(
-            f"[SIGNAL] {sig.type.name} {sig.side} {symbol} "
-            f"qty={qty:.3f} atr={sig.atr:.2f} "
-            f"regime={sig.regime.name} conf={sig.confidence:.2f}"
+            "[SIGNAL] %s %s %s qty=%.3f atr=%.2f regime=%s conf=%.2f",
+            sig.type.name, sig.side, symbol, qty, sig.atr,
+            sig.regime.name, sig.confidence,
         )
         # TODO: Execute via REST client (aiohttp POST to Binance)
 
-    def _on_book_ticker(self, event: dict):
-        symbol = event["symbol"]
-        engine = self.signal_engines.get(symbol)
-        if engine:
-            engine.update_obi(event["bid_qty"], event["ask_qty"])
-
     def _on_account_update(self, data: dict):
         for balance in data.get("B", []):
             if balance.get("a") == "USDT":
                 self._balance = float(balance.get("wb", 0))
                 self.circuit_breaker.update_balance(self._balance)
-                logger.debug(f"[ACCOUNT] Balance: {self._balance:.2f} USDT")
+                logger.debug("[ACCOUNT] Balance: %.2f USDT", self._balance)
 
     # ─────────────────────────────────────────────────────────────
     # Background Tasks
     # ─────────────────────────────────────────────────────────────
 
+    def _get_shutdown_waiter(self) -> asyncio.Future:
+        """One long-lived task that resolves at shutdown, shared by all timed waits."""
+        if self._shutdown_waiter is None:
+            self._shutdown_waiter = asyncio.ensure_future(self.shutdown_event.wait())
+        return self._shutdown_waiter
+
+    async def _sleep_or_shutdown(self, timeout: float) -> bool:
+        """Wait up to `timeout` s, waking early on shutdown. True if shutting down."""
+        # asyncio.wait on the shared waiter: no per-call Task, no TimeoutError unwind
+        done, _ = await asyncio.wait({self._get_shutdown_waiter()}, timeout=timeout)
+        return bool(done)
+
     async def _orphan_checker(self):
-        """Periodically check for orphaned orders."""
+        """Check for orphaned orders while any are pending; idle otherwise."""
+        oms = self.oms
         while not self.shutdown_event.is_set():
-            await asyncio.sleep(10)
-            await self.oms.check_orphans(rest_client=None)  # TODO: pass REST client
-            self.oms.cleanup_terminal()
+            if not oms.has_pending_submits():
+                oms.submitted.clear()
+                oms.cleanup_terminal()
+                # Nothing can be orphaned — sleep until a submit (or shutdown),
+                # waking periodically so terminal orders still age out
+                submitted = asyncio.ensure_future(oms.submitted.wait())
+                await asyncio.wait(
+                    {submitted, self._get_shutdown_waiter()},
+                    timeout=oms.CLEANUP_INTERVAL_SEC,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                submitted.cancel()
+                continue
+            if await self._sleep_or_shutdown(oms.ORPHAN_CHECK_INTERVAL_SEC):
+                break
+            await oms.check_orphans(rest_client=None)  # TODO: pass REST client
+            oms.cleanup_terminal()
 
     async def _daily_reset_scheduler(self):
         """Reset CircuitBreaker counters at 00:00 UTC every day."""
-        import datetime
         while not self.shutdown_event.is_set():
-            now = datetime.datetime.now(datetime.timezone.utc)
-            # คำนวณเวลาที่เหลือจนถึง 00:00 UTC วันถัดไป
-            tomorrow = (now + datetime.timedelta(days=1)).replace(
-                hour=0, minute=0, second=5, microsecond=0
-            )
-            wait_secs = (tomorrow - now).total_seconds()
-            logger.info(f"[DAILY RESET] Next reset in {wait_secs/3600:.1f}h (at {tomorrow.strftime('%Y-%m-%d %H:%M:%S')} UTC)")
-            try:
-                await asyncio.wait_for(
-                    self.shutdown_event.wait(), timeout=wait_secs
-                )
-            except asyncio.TimeoutError:
-                pass  # ครบเวลา → reset
-
-            if not self.shutdown_event.is_set():
+            now = time.time()
+            # คำนวณเวลาที่เหลือจนถึง 00:00 UTC วันถัดไป (epoch days are UTC days)
+            wait_secs = 86400 - (now % 86400) + 5
+            next_reset = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now + wait_secs))
+            logger.info(f"[DAILY RESET] Next reset in {wait_secs/3600:.1f}h (at {next_reset} UTC)")
+            if not await self._sleep_or_shutdown(wait_secs):  # ครบเวลา → reset
                 self.circuit_breaker.reset_daily()
                 logger.info("[DAILY RESET] CircuitBreaker daily counters reset (00:00 UTC)")
 
 
+def _run(coro):
+    """Run `coro` on uvloop (winloop on Windows) when available; else asyncio.run."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl  # uvloop fork with a Windows build
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return asyncio.run(coro)
+    # loop_impl.run() builds the loop directly — no global policy swap
+    # (event loop policies are deprecated from Python 3.14)
+    runner = getattr(loop_impl, "run", None)
+    if runner is None:  # older winloop without run()
+        asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+        return asyncio.run(coro)
+    return runner(coro)
+
+
+def _pin_cpus(spec: str):
+    """Pin the process to the given CPU ids so the loop isn't migrated mid-frame."""
+    if not spec or not hasattr(os, "sched_setaffinity"):
+        return  # not configured, or not Linux
+    try:
+        cores = {int(c) for c in spec.split(",") if c.strip()}
+        os.sched_setaffinity(0, cores)
+    except (ValueError, OSError) as e:
+        logger.warning("[MAIN] CPU_AFFINITY=%r ignored: %s", spec, e)
+        return
+    logger.info("[MAIN] Pinned to CPUs %s", sorted(cores))
+
+
 def main():
-    config = TradingConfig()
-    system = LiveTradingSystem(config)
-    asyncio.run(system.run())
+    log_listener = _setup_logging()
+    try:
+        config = TradingConfig()
+        _pin_cpus(config.cpu_affinity)
+        system = LiveTradingSystem(config)
+        _run(system.run())
+    finally:
+        log_listener.stop()  # flush queued records before exit
 
 
 if __name__ == "__main__":
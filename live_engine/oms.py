@@ -29,7 +29,7 @@ class OrderState(Enum):
     ORPHANED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedOrder:
     client_order_id: str
     symbol: str
@@ -68,11 +68,14 @@ class OrderMonitor:
     Handles orphan detection and REST fallback reconciliation.
     """
     ORPHAN_TIMEOUT_SEC = 5.0
+    ORPHAN_CHECK_INTERVAL_SEC = 10.0   # sweep cadence while submits are pending
+    CLEANUP_INTERVAL_SEC = 60.0   # terminal-order purge cadence while idle
     MAX_RETRIES = 3
 
     def __init__(self):
         self.orders: dict[str, ManagedOrder] = {}
         self._fill_callbacks: list = []
+        self.submitted = asyncio.Event()  # wakes the orphan checker
 
     def register_fill_callback(self, cb):
         self._fill_callbacks.append(cb)
@@ -81,8 +84,9 @@ class OrderMonitor:
         order.state = OrderState.PENDING_SUBMIT
         order.submit_ts = time.monotonic()
         self.orders[order.client_order_id] = order
-        logger.info(f"[OMS] Submitted: {order.client_order_id} "
-                     f"{order.side} {order.quantity} {order.symbol}")
+        self.submitted.set()
+        logger.info("[OMS] Submitted: %s %s %s %s", order.client_order_id,
+                    order.side, order.quantity, order.symbol)
 
     def on_user_data_update(self, data: dict):
         """Called when ORDER_TRADE_UPDATE arrives from User Data Stream."""
@@ -91,13 +95,13 @@ class OrderMonitor:
         order = self.orders.get(coid)
 
         if not order:
-            logger.warning(f"[OMS] Unknown order update: {coid}")
+            logger.warning("[OMS] Unknown order update: %s", coid)
             return
 
         prev_state = order.state
         new_state = _STATE_MAP.get(status)
         if new_state is None:
-            logger.warning(f"[OMS] Unknown status '{status}' for {coid}")
+            logger.warning("[OMS] Unknown status '%s' for %s", status, coid)
             return
 
         order.state = new_state
@@ -106,8 +110,8 @@ class OrderMonitor:
         order.exchange_order_id = int(data.get("i", 0))
         order.last_update_ts = time.monotonic()
 
-        logger.info(f"[OMS] {coid}: {prev_state.name} → {new_state.name} "
-                     f"filled={order.filled_qty}/{order.quantity}")
+        logger.info("[OMS] %s: %s → %s filled=%s/%s", coid, prev_state.name,
+                    new_state.name, order.filled_qty, order.quantity)
 
         if new_state == OrderState.FILLED:
             for cb in self._fill_callbacks:
@@ -122,8 +126,8 @@ class OrderMonitor:
             if now - order.submit_ts < self.ORPHAN_TIMEOUT_SEC:
                 continue
 
-            logger.warning(f"[OMS] Orphan detected: {coid} "
-                           f"(age={now - order.submit_ts:.1f}s)")
+            logger.warning("[OMS] Orphan detected: %s (age=%.1fs)",
+                           coid, now - order.submit_ts)
             try:
                 resp = await rest_client.get_order(
                     symbol=order.symbol,
@@ -135,9 +139,13 @@ class OrderMonitor:
                     order.state = OrderState.ORPHANED
                     order.retry_count += 1
                     if order.retry_count >= self.MAX_RETRIES:
-                        logger.error(f"[OMS] Order {coid} permanently orphaned")
+                        logger.error("[OMS] Order %s permanently orphaned", coid)
             except Exception as e:
-                logger.error(f"[OMS] Orphan check failed: {e}")
+                logger.error("[OMS] Orphan check failed: %s", e)
+
+    def has_pending_submits(self) -> bool:
+        return any(o.state == OrderState.PENDING_SUBMIT
+                   for o in self.orders.values())
 
     def get_active_orders(self, symbol: str = "") -> list[ManagedOrder]:
         return [
@@ -169,16 +177,18 @@ class RateLimitManager:
         self.max_weight = max_weight
         self.window_sec = window_sec
         self._requests: deque[tuple[float, int]] = deque()
+        self._weight = 0  # running total of weights in _requests
 
     def _purge_old(self):
         cutoff = time.monotonic() - self.window_sec
-        while self._requests and self._requests[0][0] < cutoff:
-            self._requests.popleft()
+        requests = self._requests
+        while requests and requests[0][0] <= cutoff:
+            self._weight -= requests.popleft()[1]
 
     @property
     def current_weight(self) -> int:
         self._purge_old()
-        return sum(w for _, w in self._requests)
+        return self._weight
 
     @property
     def utilization_pct(self) -> float:
@@ -189,10 +199,17 @@ class RateLimitManager:
 
     def record(self, weight: int = 1):
         self._requests.append((time.monotonic(), weight))
+        self._weight += weight
 
     async def wait_if_needed(self, weight: int = 1):
         while not self.can_request(weight):
-            logger.warning(f"[RATE] Throttled. Weight={self.current_weight}"
-                           f"/{self.max_weight}")
-            await asyncio.sleep(0.5)
+            logger.warning("[RATE] Throttled. Weight=%d/%d",
+                           self.current_weight, self.max_weight)
+            # Sleep until the oldest entry leaves the window instead of
+            # re-polling on a fixed interval; the 1ms pad covers the loop
+            # waking up to one clock tick early
+            requests = self._requests
+            wait = (requests[0][0] + self.window_sec - time.monotonic()
+                    if requests else 0.5)
+            await asyncio.sleep(max(wait, 0.0) + 0.001)
         self.record(weight)
@@ -5,6 +5,7 @@ Dynamic position sizing + hard circuit breakers.
 
 import time
 import logging
+from collections import deque
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -76,17 +77,18 @@ class CircuitBreakerState:
     peak_balance: float = 0.0
     current_balance: float = 0.0
     session_start_ts: float = 0.0
-    latency_samples: list = None  # rolling latency window
+    latency_samples: deque = None  # rolling latency window (last 50)
 
     def __post_init__(self):
         if self.latency_samples is None:
-            self.latency_samples = []
+            self.latency_samples = deque(maxlen=50)
 
     @property
     def avg_latency_ms(self) -> float:
-        if not self.latency_samples:
+        samples = self.latency_samples
+        if not samples:
             return 0.0
-        return sum(self.latency_samples[-50:]) / len(self.latency_samples[-50:])
+        return sum(samples) / len(samples)
 
 
 class CircuitBreaker:
@@ -145,8 +147,9 @@ class CircuitBreaker:
             return self._halt(f"TRADE_LIMIT:{s.daily_trades}")
 
         # 5. Latency degradation
-        if s.avg_latency_ms > self.max_latency_ms:
-            return self._halt(f"LATENCY:{s.avg_latency_ms:.0f}ms")
+        avg_latency = s.avg_latency_ms
+        if avg_latency > self.max_latency_ms:
+            return self._halt(f"LATENCY:{avg_latency:.0f}ms")
 
         self._halted = False
         self._halt_reason = ""
@@ -155,7 +158,7 @@ class CircuitBreaker:
     def _halt(self, reason: str) -> tuple[bool, str]:
         self._halted = True
         self._halt_reason = reason
-        logger.critical(f"[CIRCUIT BREAKER] HALTED: {reason}")
+        logger.critical("[CIRCUIT BREAKER] HALTED: %s", reason)
         return False, reason
 
     def record_trade(self, pnl: float):
@@ -173,9 +176,7 @@ class CircuitBreaker:
             self.state.peak_balance = balance
 
     def record_latency(self, latency_ms: float):
-        self.state.latency_samples.append(latency_ms)
-        if len(self.state.latency_samples) > 200:
-            self.state.latency_samples = self.state.latency_samples[-100:]
+        self.state.latency_samples.append(latency_ms)  # deque evicts oldest
 
     def reset_daily(self):
         """Call at session start (00:00 UTC)."""
@@ -8,11 +8,11 @@ import numpy as np
 import logging
 from enum import Enum
 from dataclasses import dataclass, field
-from collections import deque
 
 from .indicators import (
-    calc_ema, calc_rsi, calc_atr, calc_bollinger,
-    detect_squeeze, calc_vwap, calc_rvol, order_book_imbalance,
+    calc_ema3, calc_rsi, calc_atr, calc_bollinger,
+    calc_bandwidth, squeeze_from_bandwidths,
+    calc_vwap, calc_rvol, atr_percentile_rank, order_book_imbalance,
 )
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 # Volume Bar Aggregator
 # ─────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class VolumeBar:
     open: float = 0.0
     high: float = -float('inf')
@@ -39,44 +39,67 @@ class VolumeBar:
     def cvd(self) -> float:
         return self.buy_volume - self.sell_volume
 
+    def reset(self):
+        """Return to the empty state so the instance can be reused."""
+        self.open = 0.0
+        self.high = -float('inf')
+        self.low = float('inf')
+        self.close = 0.0
+        self.volume = 0.0
+        self.buy_volume = 0.0
+        self.sell_volume = 0.0
+        self.tick_count = 0
+        self.ts_start = 0
+        self.ts_end = 0
+
 
 class VolumeBarAggregator:
-    """Aggregates aggTrades into volume bars of fixed notional size."""
+    """
+    Aggregates aggTrades into volume bars of fixed notional size.
+    Two VolumeBar instances are recycled: a returned bar stays valid
+    until the next bar completes (callers consume it immediately).
+    """
 
     def __init__(self, threshold_usd: float = 50_000.0):
         self.threshold = threshold_usd
         self._current = VolumeBar()
+        self._spare = VolumeBar()
         self._accumulated_notional = 0.0
 
     def on_trade(self, price: float, qty: float,
                  is_buyer_maker: bool, ts: int) -> VolumeBar | None:
         notional = price * qty
-
-        if self._current.tick_count == 0:
-            self._current.open = price
-            self._current.high = price
-            self._current.low = price
-            self._current.ts_start = ts
-
-        self._current.high = max(self._current.high, price)
-        self._current.low = min(self._current.low, price)
-        self._current.close = price
-        self._current.volume += qty
-        self._current.tick_count += 1
-        self._current.ts_end = ts
+        bar = self._current  # hoisted: one attribute load instead of ~10
+
+        if bar.tick_count == 0:
+            bar.open = price
+            bar.high = price
+            bar.low = price
+            bar.ts_start = ts
+
+        if price > bar.high:
+            bar.high = price
+        if price < bar.low:
+            bar.low = price
+        bar.close = price
+        bar.volume += qty
+        bar.tick_count += 1
+        bar.ts_end = ts
 
         if is_buyer_maker:
-            self._current.sell_volume += qty
+            bar.sell_volume += qty
         else:
-            self._current.buy_volume += qty
+            bar.buy_volume += qty
 
         self._accumulated_notional += notional
 
         if self._accumulated_notional >= self.threshold:
-            completed = self._current
-            self._current = VolumeBar()
+            spare = self._spare
+            spare.reset()
+            self._current = spare
+            self._spare = bar
             self._accumulated_notional = 0.0
-            return completed
+            return bar
         return None
 
 
@@ -100,7 +123,7 @@ class MarketRegime(Enum):
     VOLATILE = 2    # Reduce size 50%
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     type: SignalType
     regime: MarketRegime
@@ -118,13 +141,21 @@ class CVDTracker:
     """Tracks Cumulative Volume Delta over a rolling window."""
 
     def __init__(self, window: int = 100):
-        self.deltas: deque[float] = deque(maxlen=window)
+        self._window = window
+        self.deltas = np.zeros(window)   # preallocated ring, no per-tick alloc
+        self._idx = 0                    # total updates; slot = _idx % window
         self.cumulative: float = 0.0
 
     def update(self, qty: float, is_buyer_maker: bool) -> float:
         delta = -qty if is_buyer_maker else qty
-        self.deltas.append(delta)
-        self.cumulative = sum(self.deltas)
+        slot = self._idx % self._window
+        # Running sum: add new, subtract the delta it overwrites (0 until full)
+        self.cumulative += delta - self.deltas[slot]
+        self.deltas[slot] = delta
+        self._idx += 1
+        if slot == self._window - 1:
+            # Resync once per wrap so float error can't accumulate
+            self.cumulative = float(self.deltas.sum())
         return self.cumulative
 
 
@@ -192,10 +223,8 @@ def detect_regime(atr_history: np.ndarray, closes: np.ndarray,
     if len(atr_history) < 50:
         return MarketRegime.TRENDING  # not enough data
 
-    # ATR percentile rank
-    current_atr = atr_history[-1]
-    sorted_atr = np.sort(atr_history[-100:])
-    pctile = np.searchsorted(sorted_atr, current_atr) / len(sorted_atr)
+    # ATR percentile rank (count below current — no sort needed)
+    pctile = atr_percentile_rank(atr_history, 100)
 
     # EMA convergence check (all 3 EMAs within 0.05% = choppy)
     price = closes[-1] if len(closes) > 0 else 1.0
@@ -227,13 +256,22 @@ class SignalEngine:
         buf_size = max(config.ema_trend, config.bb_period,
                        config.atr_period) + config.bb_squeeze_lookback + 50
 
-        self.closes = np.zeros(buf_size, dtype=np.float64)
-        self.highs = np.zeros(buf_size, dtype=np.float64)
-        self.lows = np.zeros(buf_size, dtype=np.float64)
-        self.volumes = np.zeros(buf_size, dtype=np.float64)
-        self.atr_history = np.zeros(200, dtype=np.float64)
+        # Mirrored ring buffers: every sample is written at idx and
+        # idx + size, so the last `size` samples are always a contiguous
+        # chronological view — no np.roll copy per bar.
+        self._buf_size = buf_size
+        self.closes = np.zeros(2 * buf_size, dtype=np.float64)
+        self.highs = np.zeros(2 * buf_size, dtype=np.float64)
+        self.lows = np.zeros(2 * buf_size, dtype=np.float64)
+        self.volumes = np.zeros(2 * buf_size, dtype=np.float64)
+        self._atr_size = 200
+        self.atr_history = np.zeros(2 * self._atr_size, dtype=np.float64)
+        # One BB bandwidth per bar, so the squeeze check reuses past windows
+        self._bw_size = config.bb_squeeze_lookback
+        self.bw_history = np.zeros(2 * self._bw_size, dtype=np.float64)
         self._buf_idx = 0
         self._atr_idx = 0
+        self._bw_idx = 0
         self._bar_count = 0
 
         # Previous bar state
@@ -257,45 +295,62 @@ class SignalEngine:
     def on_volume_bar(self, bar: VolumeBar) -> Signal | None:
         """Process a completed volume bar and return a signal (or None)."""
         cfg = self.cfg
-        idx = self._buf_idx % len(self.closes)
-        self.closes[idx] = bar.close
-        self.highs[idx] = bar.high
-        self.lows[idx] = bar.low
-        self.volumes[idx] = bar.volume
+        size = self._buf_size
+        idx = self._buf_idx % size
+        for buf, val in ((self.closes, bar.close), (self.highs, bar.high),
+                         (self.lows, bar.low), (self.volumes, bar.volume)):
+            buf[idx] = val
+            buf[idx + size] = val
         self._buf_idx += 1
         self._bar_count += 1
 
+        # Contiguous chronological views for indicators (no copies)
+        n = min(self._buf_idx, size)
+        start = (self._buf_idx - n) % size
+        c = self.closes[start:start + n]
+
+        if n >= cfg.bb_period:
+            bw = calc_bandwidth(c, cfg.bb_period, cfg.bb_std)
+            bsize = self._bw_size
+            bidx = self._bw_idx % bsize
+            self.bw_history[bidx] = bw
+            self.bw_history[bidx + bsize] = bw
+            self._bw_idx += 1
+
         if self._bar_count < cfg.bb_squeeze_lookback + cfg.bb_period:
             return None
 
-        # Get contiguous arrays for indicators
-        n = min(self._buf_idx, len(self.closes))
-        c = np.roll(self.closes, -max(0, self._buf_idx - len(self.closes)))[:n]
-        h = np.roll(self.highs, -max(0, self._buf_idx - len(self.highs)))[:n]
-        l = np.roll(self.lows, -max(0, self._buf_idx - len(self.lows)))[:n]
-        v = np.roll(self.volumes, -max(0, self._buf_idx - len(self.volumes)))[:n]
+        h = self.highs[start:start + n]
+        l = self.lows[start:start + n]
+        v = self.volumes[start:start + n]
 
         # ── Calculate all indicators ──
-        ema_f = calc_ema(c, cfg.ema_fast)
-        ema_m = calc_ema(c, cfg.ema_medium)
-        ema_t = calc_ema(c, cfg.ema_trend)
+        ema_f, ema_m, ema_t = calc_ema3(
+            c, cfg.ema_fast, cfg.ema_medium, cfg.ema_trend
+        )
         vwap = calc_vwap(c, v, cfg.vwap_period)
         rsi = calc_rsi(c, cfg.rsi_period)
         atr = calc_atr(h, l, c, cfg.atr_period)
         bb_u, bb_mid, bb_l = calc_bollinger(c, cfg.bb_period, cfg.bb_std)
-        is_squeeze = detect_squeeze(c, cfg.bb_period, cfg.bb_std,
-                                     cfg.bb_squeeze_lookback)
+        bw_n = min(self._bw_idx, self._bw_size)
+        bstart = (self._bw_idx - bw_n) % self._bw_size
+        is_squeeze = squeeze_from_bandwidths(
+            self.bw_history[bstart:bstart + bw_n], cfg.bb_squeeze_lookback
+        )
         rvol = calc_rvol(v, 20)
 
         # Track ATR history for regime
-        aidx = self._atr_idx % len(self.atr_history)
+        asize = self._atr_size
+        aidx = self._atr_idx % asize
         self.atr_history[aidx] = atr
+        self.atr_history[aidx + asize] = atr
         self._atr_idx += 1
 
         # ── Regime filter ──
-        atr_n = min(self._atr_idx, len(self.atr_history))
+        atr_n = min(self._atr_idx, asize)
+        astart = (self._atr_idx - atr_n) % asize
         regime = detect_regime(
-            self.atr_history[:atr_n], c, ema_f, ema_m, ema_t
+            self.atr_history[astart:astart + atr_n], c, ema_f, ema_m, ema_t
         )
         if regime == MarketRegime.CHOPPY:
             self._save_prev_state(ema_f, ema_m, bar.close, bb_u, bb_l, is_squeeze)
@@ -5,6 +5,7 @@ with reconnection, sequence tracking, and listenKey renewal.
 """
 
 import time
+import random
 import asyncio
 import logging
 
@@ -14,6 +15,27 @@ import orjson
 logger = logging.getLogger(__name__)
 
 
+class _Backoff:
+    """Per-stream reconnect delay: doubles on failure up to `cap`, resets on connect."""
+
+    __slots__ = ("delay", "initial", "cap")
+
+    def __init__(self, initial: float = 1.0, cap: float = 60.0):
+        self.initial = initial
+        self.cap = cap
+        self.delay = initial
+
+    def reset(self):
+        self.delay = self.initial
+
+    def next_sleep(self) -> float:
+        """Current delay with ±25% jitter (so reconnects after a venue-wide
+        drop don't align), then advance the delay for the next failure."""
+        sleep = self.delay * random.uniform(0.75, 1.25)
+        self.delay = min(self.delay * 2, self.cap)
+        return sleep
+
+
 class BinanceWSManager:
     """
     Manages dual WebSocket connections:
@@ -25,13 +47,30 @@ class BinanceWSManager:
         self.cfg = config
         self.event_queue = event_queue
         self._last_agg_trade_id: dict[str, int] = {}
-        self._reconnect_delay = 1.0
-        self._max_reconnect_delay = 60.0
+        # Latest top-of-book per symbol: (bid, bid_qty, ask, ask_qty)
+        self.book_tops: dict[str, tuple[float, float, float, float]] = {}
+        self._market_backoff = _Backoff()
+        self._user_backoff = _Backoff()
         self._listen_key: str = ""
         self._running = True
+        self._session: aiohttp.ClientSession | None = None
 
     async def stop(self):
         self._running = False
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        One shared session (connection pool, DNS cache) for WS and REST calls.
+        Raises once stop() has run, so a loop racing shutdown can't open a
+        new session that nothing would close; stop() owns its lifetime.
+        """
+        if not self._running:
+            raise RuntimeError("BinanceWSManager is stopped")
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
 
     # ─────────────────────────────────────────────────────────────
     # Market Data Stream
@@ -45,44 +84,46 @@ class BinanceWSManager:
             streams.extend([f"{sl}@aggTrade", f"{sl}@bookTicker"])
 
         url = f"{self.cfg.ws_base}/stream?streams={'/'.join(streams)}"
+        # Resolved once, not per frame, in the receive loop below
+        handle = self._handle_market_msg
+        TEXT = aiohttp.WSMsgType.TEXT
+        CLOSING = (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR)
 
         while self._running:
             try:
-                async with aiohttp.ClientSession() as session:
-                    logger.info(f"[WS] Connecting market stream: {url[:80]}...")
-                    async with session.ws_connect(
-                        url, heartbeat=15, max_msg_size=0
-                    ) as ws:
-                        self._reconnect_delay = 1.0
-                        logger.info("[WS] Market stream connected")
-                        async for msg in ws:
-                            if not self._running:
-                                break
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                await self._handle_market_msg(msg.data)
-                            elif msg.type in (aiohttp.WSMsgType.CLOSED,
-                                              aiohttp.WSMsgType.ERROR):
-                                logger.warning(f"[WS] Market stream: {msg.type}")
-                                break
+                logger.info(f"[WS] Connecting market stream: {url[:80]}...")
+                async with self._get_session().ws_connect(
+                    url, heartbeat=15, max_msg_size=0
+                ) as ws:
+                    self._market_backoff.reset()
+                    logger.info("[WS] Market stream connected")
+                    async for msg in ws:
+                        if not self._running:
+                            break
+                        mtype = msg.type
+                        if mtype == TEXT:
+                            await handle(msg.data)
+                        elif mtype in CLOSING:
+                            logger.warning("[WS] Market stream: %s", mtype)
+                            break
             except asyncio.CancelledError:
                 return
             except Exception as e:
-                logger.error(f"[WS] Market stream error: {e}")
+                logger.error("[WS] Market stream error: %s", e)
 
             if self._running:
-                logger.info(f"[WS] Reconnecting in {self._reconnect_delay:.0f}s...")
-                await asyncio.sleep(self._reconnect_delay)
-                self._reconnect_delay = min(
-                    self._reconnect_delay * 2, self._max_reconnect_delay
-                )
+                sleep = self._market_backoff.next_sleep()
+                logger.info("[WS] Reconnecting in %.1fs...", sleep)
+                await asyncio.sleep(sleep)
 
     async def _handle_market_msg(self, raw: str):
         ts_recv = time.monotonic_ns()
         data = orjson.loads(raw)
-        stream = data.get("stream", "")
+        # "<symbol>@<kind>" — one split instead of substring scans per frame
+        kind = data.get("stream", "").partition("@")[2]
         payload = data.get("data", {})
 
-        if "aggTrade" in stream:
+        if kind == "aggTrade":
             symbol = payload["s"]
             trade_id = payload["a"]
 
@@ -90,7 +131,7 @@ class BinanceWSManager:
             last = self._last_agg_trade_id.get(symbol, trade_id - 1)
             if trade_id > last + 1:
                 gap = trade_id - last - 1
-                logger.warning(f"[WS] {symbol} aggTrade gap: {gap} trades missed")
+                logger.warning("[WS] %s aggTrade gap: %d trades missed", symbol, gap)
             self._last_agg_trade_id[symbol] = trade_id
 
             await self.event_queue.put({
@@ -104,16 +145,13 @@ class BinanceWSManager:
                 "ts_recv": ts_recv,
             })
 
-        elif "bookTicker" in stream:
-            await self.event_queue.put({
-                "type": "book_ticker",
-                "symbol": payload["s"],
-                "bid": float(payload["b"]),
-                "bid_qty": float(payload["B"]),
-                "ask": float(payload["a"]),
-                "ask_qty": float(payload["A"]),
-                "ts_recv": ts_recv,
-            })
+        elif kind == "bookTicker":
+            # Overwrite-in-place slot instead of queueing every update:
+            # only the newest book matters and it is read at bar close
+            self.book_tops[payload["s"]] = (
+                float(payload["b"]), float(payload["B"]),
+                float(payload["a"]), float(payload["A"]),
+            )
 
     # ─────────────────────────────────────────────────────────────
     # User Data Stream
@@ -133,11 +171,12 @@ class BinanceWSManager:
                 renew_task = asyncio.create_task(self._renew_listen_key_loop())
 
                 url = f"{self.cfg.ws_base}/ws/{self._listen_key}"
-                async with aiohttp.ClientSession() as session:
+                try:
                     logger.info("[WS] Connecting user data stream...")
-                    async with session.ws_connect(
+                    async with self._get_session().ws_connect(
                         url, heartbeat=15, max_msg_size=0
                     ) as ws:
+                        self._user_backoff.reset()
                         logger.info("[WS] User data stream connected")
                         async for msg in ws:
                             if not self._running:
@@ -147,14 +186,17 @@ class BinanceWSManager:
                             elif msg.type in (aiohttp.WSMsgType.CLOSED,
                                               aiohttp.WSMsgType.ERROR):
                                 break
-                renew_task.cancel()
+                finally:
+                    # Also on error/cancel — otherwise each failed connect
+                    # leaves another renewal loop running
+                    renew_task.cancel()
             except asyncio.CancelledError:
                 return
             except Exception as e:
-                logger.error(f"[WS] User stream error: {e}")
+                logger.error("[WS] User stream error: %s", e)
 
             if self._running:
-                await asyncio.sleep(2)
+                await asyncio.sleep(self._user_backoff.next_sleep())
 
     async def _handle_user_msg(self, raw: str):
         data = orjson.loads(raw)
@@ -176,13 +218,12 @@ class BinanceWSManager:
     async def _get_listen_key(self) -> str:
         headers = {"X-MBX-APIKEY": self.cfg.binance_api_key}
         try:
-            async with aiohttp.ClientSession() as s:
-                async with s.post(
-                    f"{self.cfg.rest_base}/fapi/v1/listenKey",
-                    headers=headers,
-                ) as r:
-                    resp = await r.json()
-                    return resp.get("listenKey", "")
+            async with self._get_session().post(
+                f"{self.cfg.rest_base}/fapi/v1/listenKey",
+                headers=headers,
+            ) as r:
+                resp = await r.json(loads=orjson.loads)
+                return resp.get("listenKey", "")
         except Exception as e:
             logger.error(f"[WS] listenKey error: {e}")
             return ""
@@ -193,14 +234,13 @@ class BinanceWSManager:
         while self._running:
             await asyncio.sleep(30 * 60)
             try:
-                async with aiohttp.ClientSession() as s:
-                    async with s.put(
-                        f"{self.cfg.rest_base}/fapi/v1/listenKey",
-                        headers=headers,
-                    ) as r:
-                        if r.status == 200:
-                            logger.info("[WS] listenKey renewed")
-                        else:
-                            logger.warning(f"[WS] listenKey renew failed: {r.status}")
+                async with self._get_session().put(
+                    f"{self.cfg.rest_base}/fapi/v1/listenKey",
+                    headers=headers,
+                ) as r:
+                    if r.status == 200:
+                        logger.info("[WS] listenKey renewed")
+                    else:
+                        logger.warning(f"[WS] listenKey renew failed: {r.status}")
             except Exception as e:
                 logger.error(f"[WS] listenKey renew error: {e}")
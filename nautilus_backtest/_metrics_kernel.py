@@ -0,0 +1,104 @@
+"""
+_metrics_kernel.py — Single-pass risk metrics over a realized-PnL series
+=========================================================================
+Fuses what analytics._risk_metrics used to do in separate NumPy passes
+(cumsum, running peak, drawdown, win/loss masks, mean/std, streaks) into
+one sequential loop, JIT-compiled with Numba.
+
+Usage:
+    from _metrics_kernel import compute_metrics
+    if compute_metrics is not None:
+        (total_pnl, wins, gross_win, gross_loss, mean_ret, std_ret,
+         neg_std, max_dd, max_consec_w, max_consec_l) = compute_metrics(arr)
+
+`compute_metrics` is None when numba is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _compute_metrics(arr: np.ndarray):
+    """
+    One pass over `arr` (float64 PnL per closed position, in close order).
+
+    Returns:
+        (total_pnl, wins, gross_win, gross_loss, mean, std, neg_std,
+         max_drawdown, max_consecutive_wins, max_consecutive_losses)
+
+        std / neg_std are population std (ddof=0) of all / negative PnLs,
+        neg_std is 1e-9 when there are no losing trades. Drawdown is
+        measured from the running peak of cumulative PnL. A PnL <= 0
+        counts as a loss for gross_loss and streaks.
+    """
+    n = arr.shape[0]
+    total = 0.0
+    gross_win = 0.0
+    gross_loss = 0.0
+    wins = 0
+
+    # Welford accumulators: all trades, and losing (< 0) trades only
+    mean = 0.0
+    m2 = 0.0
+    neg_n = 0
+    neg_mean = 0.0
+    neg_m2 = 0.0
+
+    cum = 0.0
+    peak = 0.0
+    max_dd = 0.0
+
+    cur_w = 0
+    cur_l = 0
+    max_w = 0
+    max_l = 0
+
+    for i in range(n):
+        v = arr[i]
+        total += v
+
+        cum += v
+        if i == 0 or cum > peak:
+            peak = cum
+        dd = cum - peak
+        if dd < max_dd:
+            max_dd = dd
+
+        delta = v - mean
+        mean += delta / (i + 1)
+        m2 += delta * (v - mean)
+
+        if v > 0:
+            wins += 1
+            gross_win += v
+            cur_w += 1
+            cur_l = 0
+            if cur_w > max_w:
+                max_w = cur_w
+        else:
+            gross_loss += v
+            cur_l += 1
+            cur_w = 0
+            if cur_l > max_l:
+                max_l = cur_l
+            if v < 0:
+                neg_n += 1
+                nd = v - neg_mean
+                neg_mean += nd / neg_n
+                neg_m2 += nd * (v - neg_mean)
+
+    std = (m2 / n) ** 0.5 if n > 0 else 0.0
+    neg_std = (neg_m2 / neg_n) ** 0.5 if neg_n > 0 else 1e-9
+    return (total, wins, gross_win, gross_loss, mean, std, neg_std,
+            max_dd, max_w, max_l)
+
+
+# None without numba (backtest requirements don't pin it): as plain Python
+# the loop would be slower than the NumPy passes, which callers keep instead
+compute_metrics = njit(cache=True)(_compute_metrics) if njit is not None else None
@@ -19,7 +19,9 @@ Usage:
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+import math
+import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -35,9 +37,23 @@ try:
 except ImportError:
     _PANDAS_OK = False
 
+try:
+    import orjson                  # optional: faster summary.json (live_engine dep)
+except ImportError:
+    orjson = None
+
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.model.identifiers import Venue
 
+from _metrics_kernel import compute_metrics
+
+
+def _finite_or_none(value):
+    """Map inf/NaN to None so summary.json is the same with or without orjson."""
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        return None
+    return value
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # BacktestAnalytics
@@ -56,11 +72,19 @@ class BacktestAnalytics:
         self.engine      = engine
         self.reports_dir = reports_dir
         self.reports_dir.mkdir(parents=True, exist_ok=True)
-        self.ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        self.ts = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
 
         self._orders_df:    Optional[object] = None
         self._positions_df: Optional[object] = None
         self._account_df:   Optional[object] = None
+        # (df, pnl) — memoized _extract_pnl_series result for that exact frame
+        self._pnl_series_cache: Optional[tuple] = None
+        # (pnl, cum_pnl, peak, drawdown) — shared by both plots, see _equity_arrays
+        self._equity_cache: Optional[tuple] = None
+        # id(df) → (df, column names, lowered → original) for _find_column
+        self._colmap_cache: dict[int, tuple] = {}
+        # One Figure reused for both PNG reports (see _report_figure)
+        self._fig = None
 
     # ─────────────────────────────────────────────────────────────────────────
     # Public entry point
@@ -80,6 +104,7 @@ class BacktestAnalytics:
         if self._positions_df is not None and len(self._positions_df) > 0:
             self._equity_curve()
             self._drawdown_analysis()
+            self._close_report_figure()
             self._per_instrument_summary()
             self._risk_metrics()
             self._print_console_summary()
@@ -134,6 +159,21 @@ class BacktestAnalytics:
         self._save_positions_report()
         self._save_account_report()
 
+    def _report_figure(self, width: float, height: float):
+        """Shared Figure, cleared and resized — avoids building one per plot."""
+        fig = self._fig
+        if fig is None:
+            fig = self._fig = plt.figure(figsize=(width, height))
+        else:
+            fig.clear()
+            fig.set_size_inches(width, height)
+        return fig, fig.add_subplot()
+
+    def _close_report_figure(self) -> None:
+        if self._fig is not None:
+            plt.close(self._fig)
+            self._fig = None
+
     # ─────────────────────────────────────────────────────────────────────────
     # Equity Curve
     # ─────────────────────────────────────────────────────────────────────────
@@ -141,30 +181,28 @@ class BacktestAnalytics:
     def _equity_curve(self) -> None:
         """Plot cumulative realized PnL across all closed positions."""
         df  = self._positions_df
-        pnl = self._extract_pnl_series(df)
-        if pnl is None or len(pnl) == 0:
+        arrays = self._equity_arrays(df)
+        if arrays is None:
             return
+        cum_pnl, peak, _ = arrays
 
-        cum_pnl  = pnl.cumsum()
-        peak     = cum_pnl.cummax()
-
-        fig, ax = plt.subplots(figsize=(14, 6))
-        ax.plot(cum_pnl.values, linewidth=1.4, color="#2196F3", label="Cumulative PnL")
-        ax.plot(peak.values, linewidth=0.8, color="#4CAF50", linestyle="--",
+        fig, ax = self._report_figure(14, 6)
+        ax.plot(cum_pnl, linewidth=1.4, color="#2196F3", label="Cumulative PnL")
+        ax.plot(peak, linewidth=0.8, color="#4CAF50", linestyle="--",
                 alpha=0.7, label="Peak Equity")
         ax.fill_between(
             range(len(cum_pnl)),
-            cum_pnl.values,
+            cum_pnl,
             0,
-            where=(cum_pnl.values >= 0),
+            where=(cum_pnl >= 0),
             alpha=0.15,
             color="#4CAF50",
         )
         ax.fill_between(
             range(len(cum_pnl)),
-            cum_pnl.values,
+            cum_pnl,
             0,
-            where=(cum_pnl.values < 0),
+            where=(cum_pnl < 0),
             alpha=0.15,
             color="#F44336",
         )
@@ -179,7 +217,6 @@ class BacktestAnalytics:
 
         path = self.reports_dir / f"{self.ts}_equity_curve.png"
         fig.savefig(path, dpi=150)
-        plt.close(fig)
         print(f"  [Saved] {path.name}")
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -188,24 +225,21 @@ class BacktestAnalytics:
 
     def _drawdown_analysis(self) -> None:
         """Plot drawdown from peak equity for all closed positions."""
-        import pandas as pd
-        df  = self._positions_df
-        pnl = self._extract_pnl_series(df)
-        if pnl is None or len(pnl) == 0:
+        df     = self._positions_df
+        arrays = self._equity_arrays(df)
+        if arrays is None:
             return
 
-        cum_pnl  = pnl.cumsum()
-        peak     = cum_pnl.cummax()
-        drawdown = cum_pnl - peak
-        max_dd   = drawdown.min()
-        max_dd_i = drawdown.idxmin()
+        drawdown = arrays[2]
+        max_dd_i = int(drawdown.argmin())   # trade # (x position), not index label
+        max_dd   = drawdown[max_dd_i]
 
-        fig, ax = plt.subplots(figsize=(14, 4))
-        ax.fill_between(range(len(drawdown)), drawdown.values, 0,
+        fig, ax = self._report_figure(14, 4)
+        ax.fill_between(range(len(drawdown)), drawdown, 0,
                         alpha=0.5, color="#F44336", label="Drawdown")
         ax.axhline(y=max_dd, color="#B71C1C", linestyle="--", linewidth=1.0,
                    label=f"Max DD: {max_dd:.2f} USDT")
-        ax.axvline(x=int(max_dd_i), color="#FF9800", linestyle=":",
+        ax.axvline(x=max_dd_i, color="#FF9800", linestyle=":",
                    linewidth=1.0, alpha=0.8)
         ax.set_title("Drawdown from Peak Equity", fontsize=14)
         ax.set_xlabel("Trade #")
@@ -217,7 +251,6 @@ class BacktestAnalytics:
 
         path = self.reports_dir / f"{self.ts}_drawdown.png"
         fig.savefig(path, dpi=150)
-        plt.close(fig)
         print(f"  [Saved] {path.name}")
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -237,55 +270,63 @@ class BacktestAnalytics:
         if iid_col is None:
             return
 
-        df_work = df.copy()
-        df_work["_pnl"] = pnl.values
-
-        summary_rows = []
-        for sym, grp in df_work.groupby(iid_col):
-            p          = grp["_pnl"].astype(float)
-            total      = len(p)
-            wins       = int((p > 0).sum())
-            losses     = int((p <= 0).sum())
-            win_rate   = wins / total * 100 if total > 0 else 0.0
-            gross_win  = float(p[p > 0].sum()) if (p > 0).any() else 0.0
-            gross_loss = float(p[p <= 0].sum()) if (p <= 0).any() else 0.0
-            pf         = (
-                gross_win / abs(gross_loss)
-                if gross_loss != 0 else float("inf")
-            )
-            summary_rows.append({
-                "symbol":      str(sym).split("-PERP")[0],
-                "total_trades": total,
-                "wins":         wins,
-                "losses":       losses,
-                "win_rate_%":   round(win_rate, 1),
-                "total_pnl":    round(float(p.sum()), 4),
-                "avg_pnl":      round(float(p.mean()), 4),
-                "max_win":      round(float(p.max()), 4),
-                "max_loss":     round(float(p.min()), 4),
-                "profit_factor": round(pf, 3),
-            })
-
-        if not summary_rows:
+        # Only the two columns the aggregation needs, not a copy of the report
+        df_work = pd.DataFrame({
+            iid_col: df[iid_col].to_numpy(),
+            "_pnl":  pnl.to_numpy(dtype=float),
+        })
+        if df_work.empty:
             return
 
-        summary_df = pd.DataFrame(summary_rows)
+        # One vectorized groupby over all symbols instead of a Python loop
+        win = df_work["_pnl"] > 0
+        df_work["_win"]     = win
+        df_work["_pos_pnl"] = df_work["_pnl"].where(win, 0.0)
+        df_work["_neg_pnl"] = df_work["_pnl"].where(~win, 0.0)
+        agg = df_work.groupby(iid_col).agg(
+            total_trades=("_pnl", "size"),
+            wins=("_win", "sum"),
+            total_pnl=("_pnl", "sum"),
+            avg_pnl=("_pnl", "mean"),
+            max_win=("_pnl", "max"),
+            max_loss=("_pnl", "min"),
+            gross_win=("_pos_pnl", "sum"),
+            gross_loss=("_neg_pnl", "sum"),
+        )
+        total_trades = agg["total_trades"].astype(int)
+        wins         = agg["wins"].astype(int)
+        gross_loss   = agg["gross_loss"].abs()
+        pf = (agg["gross_win"] / gross_loss).where(gross_loss != 0, float("inf"))
+
+        summary_df = pd.DataFrame({
+            "symbol":        [str(sym).split("-PERP")[0] for sym in agg.index],
+            "total_trades":  total_trades.to_numpy(),
+            "wins":          wins.to_numpy(),
+            "losses":        (total_trades - wins).to_numpy(),
+            "win_rate_%":    (wins / total_trades * 100).round(1).to_numpy(),
+            "total_pnl":     agg["total_pnl"].round(4).to_numpy(),
+            "avg_pnl":       agg["avg_pnl"].round(4).to_numpy(),
+            "max_win":       agg["max_win"].round(4).to_numpy(),
+            "max_loss":      agg["max_loss"].round(4).to_numpy(),
+            "profit_factor": pf.round(3).to_numpy(),
+        })
+        summary_rows = summary_df.to_dict("records")
+
         path       = self.reports_dir / f"{self.ts}_per_instrument.csv"
         summary_df.to_csv(path, index=False)
         print(f"  [Saved] {path.name}")
 
-        # Console table
-        print(f"\n  {'─'*75}")
-        print(f"  Per-Instrument Summary")
-        print(f"  {'─'*75}")
-        header = (
+        # Console table — built once, written with a single stdout call
+        lines = [
+            f"\n  {'─'*75}",
+            f"  Per-Instrument Summary",
+            f"  {'─'*75}",
             f"  {'Symbol':<10} {'Trades':>6} {'W':>4} {'L':>4} "
-            f"{'WR%':>6} {'PnL':>10} {'AvgPnL':>9} {'MaxWin':>9} {'MaxLoss':>9} {'PF':>6}"
-        )
-        print(header)
-        print(f"  {'─'*75}")
+            f"{'WR%':>6} {'PnL':>10} {'AvgPnL':>9} {'MaxWin':>9} {'MaxLoss':>9} {'PF':>6}",
+            f"  {'─'*75}",
+        ]
         for row in summary_rows:
-            print(
+            lines.append(
                 f"  {row['symbol']:<10} {row['total_trades']:>6} "
                 f"{row['wins']:>4} {row['losses']:>4} "
                 f"{row['win_rate_%']:>5.1f}% "
@@ -295,7 +336,8 @@ class BacktestAnalytics:
                 f"{row['max_loss']:>9.2f} "
                 f"{row['profit_factor']:>6.3f}"
             )
-        print(f"  {'─'*75}")
+        lines.append(f"  {'─'*75}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Risk Metrics
@@ -308,21 +350,14 @@ class BacktestAnalytics:
         if pnl is None or len(pnl) < 2:
             return {}
 
-        arr      = pnl.values.astype(float)
-        cum_pnl  = np.cumsum(arr)
-        peak     = np.maximum.accumulate(cum_pnl)
-        drawdown = cum_pnl - peak
-
-        total      = len(arr)
-        wins       = int((arr > 0).sum())
-        gross_win  = float(arr[arr > 0].sum()) if (arr > 0).any() else 0.0
-        gross_loss = float(arr[arr <= 0].sum()) if (arr <= 0).any() else 0.0
-        mean_ret   = float(arr.mean())
-        std_ret    = float(arr.std()) if len(arr) > 1 else 1e-9
-        neg_std    = float(arr[arr < 0].std()) if (arr < 0).any() else 1e-9
-        max_dd     = float(drawdown.min())
-        total_pnl  = float(arr.sum())
-        pf         = gross_win / abs(gross_loss) if gross_loss != 0 else float("inf")
+        arr   = np.ascontiguousarray(pnl.values, dtype=np.float64)
+        total = len(arr)
+        # One fused pass (sums, mean/std, drawdown, streaks) with Numba;
+        # the separate NumPy passes otherwise
+        kernel = compute_metrics if compute_metrics is not None else self._metrics_numpy
+        (total_pnl, wins, gross_win, gross_loss, mean_ret, std_ret,
+         neg_std, max_dd, max_consec_w, max_consec_l) = kernel(arr)
+        pf = gross_win / abs(gross_loss) if gross_loss != 0 else float("inf")
 
         # Approximate annualized (assume ~50 trades per trading day)
         sharpe  = (mean_ret / std_ret) * np.sqrt(total) if std_ret > 0 else 0.0
@@ -333,9 +368,6 @@ class BacktestAnalytics:
             - ((total - wins) / total * (abs(gross_loss) / (total - wins) if (total - wins) > 0 else 0))
         )
 
-        # Find max consecutive wins/losses
-        max_consec_w, max_consec_l = self._max_consecutive(arr)
-
         self._metrics_cache = {
             "total_trades":         total,
             "total_pnl":            round(total_pnl, 4),
@@ -382,29 +414,34 @@ class BacktestAnalytics:
         pct_return = ((end_bal - start_bal) / start_bal * 100
                       if start_bal > 0 else 0.0)
 
-        print(f"\n  {'═'*65}")
-        print(f"  {'BACKTEST RESULTS':^65}")
-        print(f"  {'═'*65}")
+        lines = [
+            f"\n  {'═'*65}",
+            f"  {'BACKTEST RESULTS':^65}",
+            f"  {'═'*65}",
+        ]
         if start_bal > 0:
             sign = "+" if end_bal >= start_bal else ""
-            print(f"  Balance     : {start_bal:,.2f} → {end_bal:,.2f} USDT"
-                  f"  ({sign}{pct_return:.2f}%)")
-        print(f"  Total PnL   : {m['total_pnl']:+.4f} USDT")
-        print(f"  Trades      : {m['total_trades']}"
-              f"  (W:{int(m['total_trades'] * m['win_rate_%'] / 100)}"
-              f"  L:{m['total_trades'] - int(m['total_trades'] * m['win_rate_%'] / 100)})")
-        print(f"  Win Rate    : {m['win_rate_%']:.1f}%")
-        print(f"  Profit Factor: {m['profit_factor']:.3f}")
-        print(f"  Expectancy  : {m['expectancy_per_trade']:+.4f} USDT/trade")
-        print(f"  ─── Risk Metrics ───────────────────────────────────────")
-        print(f"  Sharpe Ratio : {m['sharpe_ratio']:.4f}")
-        print(f"  Sortino Ratio: {m['sortino_ratio']:.4f}")
-        print(f"  Calmar Ratio : {m['calmar_ratio']:.4f}")
-        print(f"  Max Drawdown : {m['max_drawdown_usdt']:.4f} USDT")
-        print(f"  ─── Streaks ─────────────────────────────────────────────")
-        print(f"  Max Consec Wins  : {m['max_consecutive_wins']}")
-        print(f"  Max Consec Losses: {m['max_consecutive_losses']}")
-        print(f"  {'═'*65}")
+            lines.append(f"  Balance     : {start_bal:,.2f} → {end_bal:,.2f} USDT"
+                         f"  ({sign}{pct_return:.2f}%)")
+        lines += [
+            f"  Total PnL   : {m['total_pnl']:+.4f} USDT",
+            f"  Trades      : {m['total_trades']}"
+            f"  (W:{int(m['total_trades'] * m['win_rate_%'] / 100)}"
+            f"  L:{m['total_trades'] - int(m['total_trades'] * m['win_rate_%'] / 100)})",
+            f"  Win Rate    : {m['win_rate_%']:.1f}%",
+            f"  Profit Factor: {m['profit_factor']:.3f}",
+            f"  Expectancy  : {m['expectancy_per_trade']:+.4f} USDT/trade",
+            f"  ─── Risk Metrics ───────────────────────────────────────",
+            f"  Sharpe Ratio : {m['sharpe_ratio']:.4f}",
+            f"  Sortino Ratio: {m['sortino_ratio']:.4f}",
+            f"  Calmar Ratio : {m['calmar_ratio']:.4f}",
+            f"  Max Drawdown : {m['max_drawdown_usdt']:.4f} USDT",
+            f"  ─── Streaks ─────────────────────────────────────────────",
+            f"  Max Consec Wins  : {m['max_consecutive_wins']}",
+            f"  Max Consec Losses: {m['max_consecutive_losses']}",
+            f"  {'═'*65}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Summary JSON
@@ -416,11 +453,16 @@ class BacktestAnalytics:
         output = {
             "timestamp":  self.ts,
             "report_dir": str(self.reports_dir),
-            "metrics":    m,
+            "metrics":    {k: _finite_or_none(v) for k, v in m.items()},
         }
         path = self.reports_dir / f"{self.ts}_summary.json"
-        with open(path, "w") as f:
-            json.dump(output, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(
+                output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(path, "w") as f:
+                json.dump(output, f, indent=2)
         print(f"  [Saved] {path.name}")
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -428,7 +470,15 @@ class BacktestAnalytics:
     # ─────────────────────────────────────────────────────────────────────────
 
     def _extract_pnl_series(self, df):
-        """Extract realized PnL series from positions DataFrame."""
+        """Extract realized PnL series from positions DataFrame (memoized per frame)."""
+        cache = self._pnl_series_cache
+        if cache is not None and cache[0] is df:
+            return cache[1]
+        pnl = self._compute_pnl_series(df)
+        self._pnl_series_cache = (df, pnl)
+        return pnl
+
+    def _compute_pnl_series(self, df):
         if df is None or len(df) == 0:
             return None
         # Nautilus may use different column names across versions
@@ -443,31 +493,74 @@ class BacktestAnalytics:
         except Exception:
             return None
 
+    def _equity_arrays(self, df):
+        """
+        (cum_pnl, peak, drawdown) float64 arrays for `df`, computed once and
+        reused by the equity and drawdown plots. None when there is no PnL.
+        """
+        pnl = self._extract_pnl_series(df)
+        if pnl is None or len(pnl) == 0:
+            return None
+        cache = self._equity_cache
+        if cache is not None and cache[0] is pnl:
+            return cache[1:]
+        cum_pnl = np.cumsum(pnl.to_numpy(dtype=np.float64))
+        peak    = np.maximum.accumulate(cum_pnl)
+        arrays  = (cum_pnl, peak, cum_pnl - peak)
+        self._equity_cache = (pnl, *arrays)
+        return arrays
+
     def _find_column(self, df, candidates: list[str]):
         """Return the first candidate column name that exists in df."""
         if df is None:
             return None
+        # Column lookups are built once per frame; the stored df reference
+        # keeps id(df) from being reused by another frame while cached
+        cached = self._colmap_cache.get(id(df))
+        if cached is None or cached[0] is not df:
+            columns = list(df.columns)
+            cached = (df, set(columns), {str(c).lower(): c for c in columns})
+            self._colmap_cache[id(df)] = cached
+        _, names, lower_cols = cached
         for col in candidates:
-            if col in df.columns:
+            if col in names:
                 return col
         # Case-insensitive fallback
-        lower_cols = {c.lower(): c for c in df.columns}
         for col in candidates:
             if col.lower() in lower_cols:
                 return lower_cols[col.lower()]
         return None
 
+    @classmethod
+    def _metrics_numpy(cls, arr: np.ndarray) -> tuple:
+        """NumPy equivalent of _metrics_kernel.compute_metrics (no numba)."""
+        cum_pnl  = np.cumsum(arr)
+        peak     = np.maximum.accumulate(cum_pnl)
+        drawdown = cum_pnl - peak
+
+        wins       = int((arr > 0).sum())
+        gross_win  = float(arr[arr > 0].sum()) if (arr > 0).any() else 0.0
+        gross_loss = float(arr[arr <= 0].sum()) if (arr <= 0).any() else 0.0
+        mean_ret   = float(arr.mean())
+        std_ret    = float(arr.std()) if len(arr) > 1 else 1e-9
+        neg_std    = float(arr[arr < 0].std()) if (arr < 0).any() else 1e-9
+        max_dd     = float(drawdown.min())
+        total_pnl  = float(arr.sum())
+        max_consec_w, max_consec_l = cls._max_consecutive(arr)
+        return (total_pnl, wins, gross_win, gross_loss, mean_ret, std_ret,
+                neg_std, max_dd, max_consec_w, max_consec_l)
+
     @staticmethod
     def _max_consecutive(arr: np.ndarray) -> tuple[int, int]:
         """Return (max_consecutive_wins, max_consecutive_losses)."""
-        max_w = max_l = cur_w = cur_l = 0
-        for v in arr:
-            if v > 0:
-                cur_w += 1
-                cur_l = 0
-                max_w = max(max_w, cur_w)
-            else:
-                cur_l += 1
-                cur_w = 0
-                max_l = max(max_l, cur_l)
+        arr = np.ascontiguousarray(arr, dtype=np.float64)
+        if arr.size == 0:
+            return 0, 0
+        wins = arr > 0                       # PnL <= 0 (incl. NaN) counts as a loss
+        # Run-length encode: edges are the indices where win/loss flips
+        edges   = np.flatnonzero(np.diff(wins.view(np.int8), prepend=-1, append=-1))
+        lengths = np.diff(edges)
+        run_win = wins[edges[:-1]]
+        max_w = int(lengths[run_win].max()) if run_win.any() else 0
+        max_l = int(lengths[~run_win].max()) if not run_win.all() else 0
         return max_w, max_l
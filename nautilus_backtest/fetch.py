@@ -14,20 +14,36 @@ Usage:
     python fetch.py --trades-only                           # only aggTrades
     python fetch.py --no-depth --no-metrics                 # skip custom data
     python fetch.py --force                                 # clear catalog first
+    python fetch.py --workers 5                             # symbols in parallel
+
+Re-runs are incremental: days already written are listed in
+catalog/fetch_manifest_<SYMBOL>.json and are not downloaded again.
 """
 
 from __future__ import annotations
 
 import io
-import csv
+import os
+import json
 import shutil
 import zipfile
+import tempfile
 import argparse
+import contextlib
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO, Iterator
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import requests
+from requests.adapters import HTTPAdapter
 
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.data import Bar, BarType, TradeTick, CustomData, DataType
@@ -36,6 +52,7 @@ from nautilus_trader.model.identifiers import InstrumentId, TradeId
 from nautilus_trader.model.instruments import CryptoPerpetual
 from nautilus_trader.model.objects import Price, Quantity
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.funcs import class_to_filename
 
 from instruments import (
     build_instrument,
@@ -47,6 +64,7 @@ from instruments import (
 # ── Constants ─────────────────────────────────────────────────────────────────
 
 CATALOG_PATH = Path(__file__).parent / "catalog"
+MANIFEST_NAME = "fetch_manifest_{symbol}.json"   # per symbol, cleared by --force
 VENUE_NAME   = "BINANCE"
 BASE_URL     = "https://data.binance.vision/data/futures/um/daily"
 
@@ -66,6 +84,17 @@ INTERVAL_MAP: dict[str, str] = {
 DEFAULT_SYMBOLS  = list(INSTRUMENT_SPECS.keys())  # all 5
 DEFAULT_INTERVAL = "1m"
 
+DOWNLOAD_WORKERS = 8   # concurrent daily-file downloads per data type
+SPOOL_MAX_BYTES  = 64 << 20   # a download stays in RAM up to this, then spills to disk
+# Rows of parsed data buffered per catalog write. Bounds the TradeTick
+# objects each process holds (times --workers); a single aggTrades day
+# above this is still written whole, as its own file.
+WRITE_BATCH_ROWS = 1_000_000
+# Parquet row-group size for catalog writes. Nautilus defaults to 5,000
+# rows, i.e. thousands of tiny groups per week of aggTrades; ~1M rows keeps
+# group metadata small and reads sequential.
+CATALOG_ROW_GROUP_ROWS = 1_048_576
+
 # ── Custom data types (GenericData wrappers) ──────────────────────────────────
 
 @dataclass
@@ -167,39 +196,295 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Clear entire catalog before downloading",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Symbols fetched in parallel processes (default: 1 = sequential, live output)",
+    )
     return p.parse_args()
 
 
 # ── Download helpers ──────────────────────────────────────────────────────────
 
-def download_zip(url: str) -> bytes | None:
-    """Download a ZIP file. Returns bytes or None if 404/error."""
-    try:
-        r = requests.get(url, timeout=30)
+# One keep-alive connection pool for the whole run, sized for the workers
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=DOWNLOAD_WORKERS))
+
+
+def download_zip(url: str) -> BinaryIO | None:
+    """
+    Stream a ZIP file into a spooled temp file (rewound, ready to read).
+    Returns None on 404; other HTTP/network errors raise
+    requests.RequestException. The body is written chunk by chunk as it
+    arrives instead of being buffered whole; zipfile needs a seekable
+    file, so it can't read the socket directly.
+    """
+    with _session.get(url, timeout=30, stream=True) as r:
         if r.status_code == 404:
             return None
         r.raise_for_status()
-        return r.content
-    except requests.RequestException as e:
-        print(f"    [WARN] {e}")
-        return None
+        buf = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        for chunk in r.iter_content(chunk_size=1 << 20):
+            buf.write(chunk)
+    buf.seek(0)
+    return buf
+
+
+def iter_downloads(
+    urls: list[str],
+) -> Iterator[BinaryIO | requests.RequestException | None]:
+    """
+    Yield download_zip(url) for each url, in order, keeping up to
+    DOWNLOAD_WORKERS requests in flight so parsing one day overlaps the
+    download of the next ones (and at most that many files sit in memory).
+
+    A failed download is yielded as its exception rather than printed from
+    the worker thread, so the caller reports it on that day's line.
+    """
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        it      = iter(urls)
+        pending = deque(pool.submit(download_zip, u)
+                        for u in islice(it, DOWNLOAD_WORKERS))
+        while pending:
+            try:
+                data = pending.popleft().result()
+            except requests.RequestException as e:
+                data = e
+            for u in islice(it, 1):
+                pending.append(pool.submit(download_zip, u))
+            yield data
+
+
+def open_csv_buffer(data: BinaryIO) -> pa.Buffer:
+    """
+    Decompress the single CSV in a downloaded ZIP (closing the download)
+    into one preallocated buffer (sized from the archive entry) and wrap
+    it as a pa.Buffer without copying — no intermediate bytes joins,
+    decode or line split.
+    """
+    with data, zipfile.ZipFile(data) as zf:
+        info = zf.infolist()[0]
+        buf  = bytearray(info.file_size)
+        view = memoryview(buf)
+        pos  = 0
+        with zf.open(info) as f:
+            while pos < info.file_size:
+                n = f.readinto(view[pos:])
+                if not n:
+                    break
+                pos += n
+    return pa.py_buffer(buf)[:pos]
+
+
+# Text each typed column accepts, used to null out bad cells when a file
+# doesn't convert cleanly (see _cast_lenient)
+_VALID_TEXT: dict[pa.DataType, str] = {
+    pa.float64():       r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$",
+    pa.int64():         r"^[+-]?\d+$",
+    pa.bool_():         r"^(?i:true|false|1|0)$",
+    pa.timestamp("s"):  r"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}$",
+}
+
+
+def _parse_csv(
+    raw: pa.Buffer,
+    columns: dict[str, pa.DataType | None],
+    column_types: dict[str, pa.DataType],
+) -> pa.Table:
+    return pacsv.read_csv(
+        pa.BufferReader(raw),
+        read_options=pacsv.ReadOptions(
+            column_names=list(columns),
+            skip_rows=1 if raw[:1].to_pybytes().isalpha() else 0,
+        ),
+        parse_options=pacsv.ParseOptions(
+            invalid_row_handler=lambda row: "skip",
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types=column_types,
+            include_columns=list(column_types),
+        ),
+    )
+
+
+def _cast_lenient(column: pa.ChunkedArray, target: pa.DataType) -> pa.ChunkedArray:
+    """Cast a string column to `target`, turning unparseable cells into nulls."""
+    if target == pa.string():
+        return column
+    try:
+        return pc.cast(column, target)
+    except pa.ArrowInvalid:
+        valid = pc.match_substring_regex(column, _VALID_TEXT[target])
+        return pc.cast(pc.if_else(valid, column, None), target)
+
+
+def read_csv_from_zip(
+    data: BinaryIO, columns: dict[str, pa.DataType | None]
+) -> pa.Table | None:
+    """
+    Unzip in-memory and parse the CSV with pyarrow into typed columns.
 
+    `columns` lists every CSV column in file order; only those with a type
+    are materialized. A header row (first cell starts with a letter) is
+    skipped — Binance ships some files with one and some without. Rows with
+    the wrong field count, empty values or a cell that doesn't parse as its
+    column type are dropped; returns None only if the file can't be read.
+    """
+    raw    = open_csv_buffer(data)
+    wanted = {name: t for name, t in columns.items() if t is not None}
+    try:
+        table = _parse_csv(raw, columns, wanted)
+    except pa.ArrowInvalid:
+        # A bad cell fails the whole typed read: re-read as text and cast
+        # column by column, so only the offending rows are lost
+        try:
+            text  = _parse_csv(raw, columns, dict.fromkeys(wanted, pa.string()))
+            table = pa.table({
+                name: _cast_lenient(text.column(name), t)
+                for name, t in wanted.items()
+            })
+        except pa.ArrowInvalid as e:
+            print(f"[WARN] {e}", end=" ")
+            return None
+    return table.drop_null()
 
-def read_csv_from_zip(data: bytes) -> list[list[str]]:
-    """Unzip in-memory, parse CSV, strip header row if first cell is non-numeric."""
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        with zf.open(zf.namelist()[0]) as f:
-            text = f.read().decode("utf-8")
 
-    rows = [r for r in csv.reader(text.splitlines()) if r]
+class FetchManifest:
+    """
+    Record of which (symbol, data type, day) files are already in the
+    catalog, so a re-run skips them instead of downloading and writing
+    duplicates. Keys look like "SOLUSDT/klines/1m/2026-02-27" and map to
+    the row count written. Saved after every catalog write.
+
+    `per_day_files` marks a catalog that already held data from before
+    manifests existed: its files cover one day each and were never
+    recorded, so multi-day batches could overlap them. Such catalogs keep
+    one write per day, as they were built.
+    """
 
-    if rows:
+    def __init__(self, path: Path):
+        self.path = path
+        self.is_new = not path.exists()
         try:
-            float(rows[0][0].strip())
-        except ValueError:
-            rows = rows[1:]  # skip header
+            saved = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            saved = {}
+        self.per_day_files: bool = saved.get("per_day_files", False)
+        self._done: dict[str, int] = saved.get("written", {})
+
+    def pending(self, prefix: str, date_strs: list[str]) -> list[str]:
+        """Dates under `prefix` not yet written; prints how many are skipped."""
+        todo = [d for d in date_strs if f"{prefix}/{d}" not in self._done]
+        if len(todo) < len(date_strs):
+            print(f"    [skip] {len(date_strs) - len(todo)} day(s) already in catalog")
+        return todo
+
+    def record(self, written: dict[str, int]) -> None:
+        self._done.update(written)
+        saved = {"per_day_files": self.per_day_files, "written": self._done}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(saved, indent=1, sort_keys=True))
+        tmp.replace(self.path)
+
+
+def catalog_has_market_data(catalog_path: Path, instrument_id: str) -> bool:
+    """
+    True if the catalog already holds trades, bars, book depth or metrics
+    for `instrument_id`. Looks in each data type's directory: a partition
+    named after the instrument (trade_tick/<id>, bar/<id>-<spec>, ...) or,
+    for custom data, files stored without an instrument partition.
+    """
+    data_dir = catalog_path / "data"
+    for data_cls in (TradeTick, Bar, BookDepthData, MarketMetrics):
+        type_dir = data_dir / class_to_filename(data_cls)
+        for path in type_dir.rglob("*.parquet"):
+            partition = path.relative_to(type_dir).parts
+            if len(partition) == 1 or partition[0].startswith(instrument_id):
+                return True
+    return False
+
+
+class CatalogBatchWriter:
+    """
+    Buffers per-day results and writes them to the catalog once
+    `batch_rows` rows are pending (and on exit), so each data type produces
+    a few large Parquet files instead of one small file per day while peak
+    memory stays bounded. Days are marked in the manifest only once their
+    batch is actually written.
+
+    A batch only ever holds consecutive days: Nautilus requires a data
+    type's files to cover disjoint time ranges, so a file spanning a day
+    that failed (or was skipped) would collide with that day's file when a
+    later run fills it in. Any gap in the dates added flushes first.
+    """
+
+    def __init__(
+        self,
+        catalog: ParquetDataCatalog,
+        manifest: FetchManifest | None = None,
+        batch_rows: int = WRITE_BATCH_ROWS,
+    ):
+        self.catalog    = catalog
+        self.manifest   = manifest
+        self.batch_rows = 1 if manifest is not None and manifest.per_day_files else batch_rows
+        self._pending: list = []
+        self._keys: dict[str, int] = {}
+        self._last_day: datetime | None = None
+
+    def add(self, items: list, kind: str, date_str: str) -> None:
+        day = datetime.fromisoformat(date_str)
+        if self._last_day is not None and day - self._last_day != timedelta(days=1):
+            self.flush()
+        self._pending.extend(items)
+        self._keys[f"{kind}/{date_str}"] = len(items)
+        self._last_day = day
+        if len(self._pending) >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.catalog.write_data(self._pending)
+            if self.manifest is not None:
+                self.manifest.record(self._keys)
+        self._pending  = []
+        self._keys     = {}
+        self._last_day = None
+
+    def __enter__(self) -> CatalogBatchWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+
+class InternCache(dict):
+    """
+    float → Price / Quantity at a fixed precision, built on first use.
+    Trade and kline values repeat heavily at tick/lot granularity, and
+    both types are immutable, so one object per distinct value is shared.
+    """
+
+    __slots__ = ("_make", "_precision")
+
+    def __init__(self, make: type, precision: int):
+        super().__init__()
+        self._make      = make
+        self._precision = precision
+
+    def __missing__(self, value: float):
+        obj = self[value] = self._make(value, precision=self._precision)
+        return obj
 
-    return rows
+
+def ms_to_ns(column: pa.ChunkedArray) -> list[int]:
+    """Epoch-millisecond int64 column → epoch nanoseconds, in one Arrow kernel."""
+    return pc.multiply(column, 1_000_000).to_pylist()
+
+
+def timestamps_to_ns(column: pa.ChunkedArray) -> list[int]:
+    """Naive UTC timestamp[s] column → epoch nanoseconds, in one Arrow kernel."""
+    return pc.multiply(column.cast(pa.int64()), 1_000_000_000).to_pylist()
 
 
 # ── aggTrades → TradeTick ─────────────────────────────────────────────────────
@@ -213,60 +498,83 @@ def read_csv_from_zip(data: bytes) -> list[list[str]]:
 #   [5] transact_time  (ms)
 #   [6] is_buyer_maker (True/False)
 
+AGG_TRADE_COLUMNS: dict[str, pa.DataType | None] = {
+    "agg_trade_id":   pa.string(),   # kept as text — TradeId takes a str
+    "price":          pa.float64(),
+    "quantity":       pa.float64(),
+    "first_trade_id": None,
+    "last_trade_id":  None,
+    "transact_time":  pa.int64(),
+    "is_buyer_maker": pa.bool_(),
+}
+
 def rows_to_trade_ticks(
-    rows: list[list[str]], instrument: CryptoPerpetual
+    table: pa.Table, instrument: CryptoPerpetual
 ) -> list[TradeTick]:
-    p   = instrument.price_precision
-    s   = instrument.size_precision
-    iid = instrument.id
+    prices = InternCache(Price, instrument.price_precision)
+    sizes  = InternCache(Quantity, instrument.size_precision)
+    iid    = instrument.id
+    # Indexed by is_buyer_maker: a buyer-maker trade was sold into (aggressor SELLER)
+    sides  = (AggressorSide.BUYER, AggressorSide.SELLER)
     ticks: list[TradeTick] = []
-    for row in rows:
-        if len(row) < 7:
-            continue
+    # Columns are converted up front (ms → ns in Arrow), so the loop body
+    # only looks up interned values and calls the TradeTick constructor
+    for trade_id, price, qty, ts_ns, is_buyer_maker in zip(
+        table.column("agg_trade_id").to_pylist(),
+        table.column("price").to_pylist(),
+        table.column("quantity").to_pylist(),
+        ms_to_ns(table.column("transact_time")),
+        table.column("is_buyer_maker").to_pylist(),
+    ):
         try:
-            ts_ns = int(row[5]) * 1_000_000   # ms → ns
-            is_buyer_maker = row[6].strip().lower() in ("true", "1")
-            aggressor = AggressorSide.SELLER if is_buyer_maker else AggressorSide.BUYER
             ticks.append(TradeTick(
                 instrument_id=iid,
-                price=Price(float(row[1]), precision=p),
-                size=Quantity(float(row[2]), precision=s),
-                aggressor_side=aggressor,
-                trade_id=TradeId(row[0]),
+                price=prices[price],
+                size=sizes[qty],
+                aggressor_side=sides[is_buyer_maker],
+                trade_id=TradeId(trade_id),
                 ts_event=ts_ns,
                 ts_init=ts_ns,
             ))
-        except (ValueError, IndexError):
+        except ValueError:
             continue
     return ticks
 
 
 def fetch_trades(
     symbol: str,
-    dates: list[datetime],
+    date_strs: list[str],
     catalog: ParquetDataCatalog,
     instrument: CryptoPerpetual,
+    manifest: FetchManifest | None = None,
 ) -> int:
     """Download aggTrades for all dates and write to catalog. Returns total ticks."""
-    total = 0
-    for date in dates:
-        date_str = date.strftime("%Y-%m-%d")
-        url = f"{BASE_URL}/aggTrades/{symbol}/{symbol}-aggTrades-{date_str}.zip"
-        print(f"    [{date_str}] aggTrades ...", end=" ", flush=True)
-
-        data = download_zip(url)
-        if data is None:
-            print("not found")
-            continue
-
-        rows  = read_csv_from_zip(data)
-        ticks = rows_to_trade_ticks(rows, instrument)
-        if ticks:
-            catalog.write_data(ticks)
-            total += len(ticks)
-            print(f"{len(ticks):>10,} ticks")
-        else:
-            print("empty")
+    total     = 0
+    kind      = f"{symbol}/aggTrades"
+    if manifest is not None:
+        date_strs = manifest.pending(kind, date_strs)
+    urls      = [
+        f"{BASE_URL}/aggTrades/{symbol}/{symbol}-aggTrades-{date_str}.zip"
+        for date_str in date_strs
+    ]
+    with CatalogBatchWriter(catalog, manifest) as writer:
+        for date_str, data in zip(date_strs, iter_downloads(urls)):
+            print(f"    [{date_str}] aggTrades ...", end=" ", flush=True)
+            if data is None:
+                print("not found")
+                continue
+            if isinstance(data, requests.RequestException):
+                print(f"failed ({data})")
+                continue
+
+            table = read_csv_from_zip(data, AGG_TRADE_COLUMNS)
+            ticks = rows_to_trade_ticks(table, instrument) if table is not None else []
+            if ticks:
+                writer.add(ticks, kind, date_str)
+                total += len(ticks)
+                print(f"{len(ticks):>10,} ticks")
+            else:
+                print("empty")
 
     return total
 
@@ -287,40 +595,61 @@ def fetch_trades(
 #  [10]  taker_buy_quote_asset_volume
 #  [11]  ignore
 
+KLINE_COLUMNS: dict[str, pa.DataType | None] = {
+    "open_time":                    pa.int64(),
+    "open":                         pa.float64(),
+    "high":                         pa.float64(),
+    "low":                          pa.float64(),
+    "close":                        pa.float64(),
+    "volume":                       pa.float64(),
+    "close_time":                   None,
+    "quote_asset_volume":           None,
+    "number_of_trades":             None,
+    "taker_buy_base_asset_volume":  None,
+    "taker_buy_quote_asset_volume": None,
+    "ignore":                       None,
+}
+
+
 def rows_to_bars(
-    rows: list[list[str]],
+    table: pa.Table,
     bar_type: BarType,
     instrument: CryptoPerpetual,
 ) -> list[Bar]:
-    p    = instrument.price_precision
-    s    = instrument.size_precision
+    prices = InternCache(Price, instrument.price_precision)
+    sizes  = InternCache(Quantity, instrument.size_precision)
     bars: list[Bar] = []
-    for row in rows:
-        if len(row) < 6:
-            continue
+    for ts_ns, o, h, l, c, v in zip(
+        ms_to_ns(table.column("open_time")),     # open_time ms → ns
+        table.column("open").to_pylist(),
+        table.column("high").to_pylist(),
+        table.column("low").to_pylist(),
+        table.column("close").to_pylist(),
+        table.column("volume").to_pylist(),
+    ):
         try:
-            ts_ns = int(row[0]) * 1_000_000  # open_time ms → ns
             bars.append(Bar(
                 bar_type=bar_type,
-                open=Price(float(row[1]),  precision=p),
-                high=Price(float(row[2]),  precision=p),
-                low=Price(float(row[3]),   precision=p),
-                close=Price(float(row[4]), precision=p),
-                volume=Quantity(float(row[5]), precision=s),
+                open=prices[o],
+                high=prices[h],
+                low=prices[l],
+                close=prices[c],
+                volume=sizes[v],
                 ts_event=ts_ns,
                 ts_init=ts_ns,
             ))
-        except (ValueError, IndexError):
+        except ValueError:
             continue
     return bars
 
 
 def fetch_bars(
     symbol: str,
-    dates: list[datetime],
+    date_strs: list[str],
     interval: str,
     catalog: ParquetDataCatalog,
     instrument: CryptoPerpetual,
+    manifest: FetchManifest | None = None,
 ) -> int:
     """Download klines for one interval and write to catalog. Returns total bars."""
     if interval not in INTERVAL_MAP:
@@ -331,27 +660,32 @@ def fetch_bars(
     bar_type = BarType.from_str(f"{iid_str}-{INTERVAL_MAP[interval]}-LAST-EXTERNAL")
     total    = 0
 
-    for date in dates:
-        date_str = date.strftime("%Y-%m-%d")
-        url = (
-            f"{BASE_URL}/klines/{symbol}/{interval}/"
-            f"{symbol}-{interval}-{date_str}.zip"
-        )
-        print(f"    [{date_str}] klines/{interval} ...", end=" ", flush=True)
-
-        data = download_zip(url)
-        if data is None:
-            print("not found")
-            continue
-
-        rows = read_csv_from_zip(data)
-        bars = rows_to_bars(rows, bar_type, instrument)
-        if bars:
-            catalog.write_data(bars)
-            total += len(bars)
-            print(f"{len(bars):>8,} bars")
-        else:
-            print("empty")
+    kind      = f"{symbol}/klines/{interval}"
+    if manifest is not None:
+        date_strs = manifest.pending(kind, date_strs)
+    urls      = [
+        f"{BASE_URL}/klines/{symbol}/{interval}/"
+        f"{symbol}-{interval}-{date_str}.zip"
+        for date_str in date_strs
+    ]
+    with CatalogBatchWriter(catalog, manifest) as writer:
+        for date_str, data in zip(date_strs, iter_downloads(urls)):
+            print(f"    [{date_str}] klines/{interval} ...", end=" ", flush=True)
+            if data is None:
+                print("not found")
+                continue
+            if isinstance(data, requests.RequestException):
+                print(f"failed ({data})")
+                continue
+
+            table = read_csv_from_zip(data, KLINE_COLUMNS)
+            bars  = rows_to_bars(table, bar_type, instrument) if table is not None else []
+            if bars:
+                writer.add(bars, kind, date_str)
+                total += len(bars)
+                print(f"{len(bars):>8,} bars")
+            else:
+                print("empty")
 
     return total
 
@@ -364,64 +698,76 @@ def fetch_bars(
 #   depth       : cumulative quantity at this level
 #   notional    : cumulative USD value at this level
 
+BOOK_DEPTH_COLUMNS: dict[str, pa.DataType | None] = {
+    "timestamp":  pa.timestamp("s"),   # UTC wall time, no offset in the file
+    "percentage": pa.float64(),
+    "depth":      pa.float64(),
+    "notional":   pa.float64(),
+}
+
+
 def rows_to_book_depth(
-    rows: list[list[str]],
+    table: pa.Table,
     instrument: CryptoPerpetual,
 ) -> list[CustomData]:
     iid_str = str(instrument.id)
     results: list[CustomData] = []
     data_type = DataType(BookDepthData)
 
-    for row in rows:
-        if len(row) < 4:
-            continue
-        try:
-            # Parse timestamp: "2026-02-27 00:00:08" → nanoseconds
-            dt = datetime.strptime(row[0].strip(), "%Y-%m-%d %H:%M:%S")
-            dt = dt.replace(tzinfo=timezone.utc)
-            ts_ns = int(dt.timestamp() * 1e9)
-
-            item = BookDepthData(
-                instrument_id=iid_str,
-                percentage=float(row[1]),
-                depth=float(row[2]),
-                notional=float(row[3]),
-                ts_event=ts_ns,
-                ts_init=ts_ns,
-            )
-            results.append(CustomData(data_type=data_type, data=item))
-        except (ValueError, IndexError):
-            continue
+    # "2026-02-27 00:00:08" was parsed by Arrow; → nanoseconds for all rows
+    for ts_ns, percentage, depth, notional in zip(
+        timestamps_to_ns(table.column("timestamp")),
+        table.column("percentage").to_pylist(),
+        table.column("depth").to_pylist(),
+        table.column("notional").to_pylist(),
+    ):
+        item = BookDepthData(
+            instrument_id=iid_str,
+            percentage=percentage,
+            depth=depth,
+            notional=notional,
+            ts_event=ts_ns,
+            ts_init=ts_ns,
+        )
+        results.append(CustomData(data_type=data_type, data=item))
 
     return results
 
 
 def fetch_book_depth(
     symbol: str,
-    dates: list[datetime],
+    date_strs: list[str],
     catalog: ParquetDataCatalog,
     instrument: CryptoPerpetual,
+    manifest: FetchManifest | None = None,
 ) -> int:
     """Download bookDepth snapshots and write to catalog. Returns total rows."""
-    total = 0
-    for date in dates:
-        date_str = date.strftime("%Y-%m-%d")
-        url = f"{BASE_URL}/bookDepth/{symbol}/{symbol}-bookDepth-{date_str}.zip"
-        print(f"    [{date_str}] bookDepth ...", end=" ", flush=True)
-
-        data = download_zip(url)
-        if data is None:
-            print("not found")
-            continue
-
-        rows = read_csv_from_zip(data)
-        items = rows_to_book_depth(rows, instrument)
-        if items:
-            catalog.write_data(items)
-            total += len(items)
-            print(f"{len(items):>8,} rows")
-        else:
-            print("empty")
+    total     = 0
+    kind      = f"{symbol}/bookDepth"
+    if manifest is not None:
+        date_strs = manifest.pending(kind, date_strs)
+    urls      = [
+        f"{BASE_URL}/bookDepth/{symbol}/{symbol}-bookDepth-{date_str}.zip"
+        for date_str in date_strs
+    ]
+    with CatalogBatchWriter(catalog, manifest) as writer:
+        for date_str, data in zip(date_strs, iter_downloads(urls)):
+            print(f"    [{date_str}] bookDepth ...", end=" ", flush=True)
+            if data is None:
+                print("not found")
+                continue
+            if isinstance(data, requests.RequestException):
+                print(f"failed ({data})")
+                continue
+
+            table = read_csv_from_zip(data, BOOK_DEPTH_COLUMNS)
+            items = rows_to_book_depth(table, instrument) if table is not None else []
+            if items:
+                writer.add(items, kind, date_str)
+                total += len(items)
+                print(f"{len(items):>8,} rows")
+            else:
+                print("empty")
 
     return total
 
@@ -433,75 +779,162 @@ def fetch_book_depth(
 #   count_toptrader_long_short_ratio, sum_toptrader_long_short_ratio,
 #   count_long_short_ratio, sum_taker_long_short_vol_ratio
 
+METRICS_COLUMNS: dict[str, pa.DataType | None] = {
+    "create_time":                      pa.timestamp("s"),
+    "symbol":                           None,
+    "sum_open_interest":                pa.float64(),
+    "sum_open_interest_value":          pa.float64(),
+    "count_toptrader_long_short_ratio": pa.float64(),
+    "sum_toptrader_long_short_ratio":   pa.float64(),
+    "count_long_short_ratio":           pa.float64(),
+    "sum_taker_long_short_vol_ratio":   pa.float64(),
+}
+
+
 def rows_to_metrics(
-    rows: list[list[str]],
+    table: pa.Table,
     instrument: CryptoPerpetual,
 ) -> list[CustomData]:
     iid_str = str(instrument.id)
     results: list[CustomData] = []
     data_type = DataType(MarketMetrics)
 
-    for row in rows:
-        if len(row) < 8:
-            continue
-        # Skip header row (first cell is "create_time")
-        if row[0].strip().lower().startswith("create"):
-            continue
-        try:
-            dt = datetime.strptime(row[0].strip(), "%Y-%m-%d %H:%M:%S")
-            dt = dt.replace(tzinfo=timezone.utc)
-            ts_ns = int(dt.timestamp() * 1e9)
-
-            item = MarketMetrics(
-                instrument_id=iid_str,
-                open_interest=float(row[2]),
-                open_interest_value=float(row[3]),
-                top_trader_ls_count=float(row[4]),
-                top_trader_ls_pos=float(row[5]),
-                global_ls_ratio=float(row[6]),
-                taker_buy_sell_ratio=float(row[7]),
-                ts_event=ts_ns,
-                ts_init=ts_ns,
-            )
-            results.append(CustomData(data_type=data_type, data=item))
-        except (ValueError, IndexError):
-            continue
+    for ts_ns, oi, oi_value, tt_count, tt_pos, global_ls, taker_ratio in zip(
+        timestamps_to_ns(table.column("create_time")),
+        table.column("sum_open_interest").to_pylist(),
+        table.column("sum_open_interest_value").to_pylist(),
+        table.column("count_toptrader_long_short_ratio").to_pylist(),
+        table.column("sum_toptrader_long_short_ratio").to_pylist(),
+        table.column("count_long_short_ratio").to_pylist(),
+        table.column("sum_taker_long_short_vol_ratio").to_pylist(),
+    ):
+        item = MarketMetrics(
+            instrument_id=iid_str,
+            open_interest=oi,
+            open_interest_value=oi_value,
+            top_trader_ls_count=tt_count,
+            top_trader_ls_pos=tt_pos,
+            global_ls_ratio=global_ls,
+            taker_buy_sell_ratio=taker_ratio,
+            ts_event=ts_ns,
+            ts_init=ts_ns,
+        )
+        results.append(CustomData(data_type=data_type, data=item))
 
     return results
 
 
 def fetch_metrics(
     symbol: str,
-    dates: list[datetime],
+    date_strs: list[str],
     catalog: ParquetDataCatalog,
     instrument: CryptoPerpetual,
+    manifest: FetchManifest | None = None,
 ) -> int:
     """Download market metrics and write to catalog. Returns total rows."""
-    total = 0
-    for date in dates:
-        date_str = date.strftime("%Y-%m-%d")
-        url = f"{BASE_URL}/metrics/{symbol}/{symbol}-metrics-{date_str}.zip"
-        print(f"    [{date_str}] metrics  ...", end=" ", flush=True)
-
-        data = download_zip(url)
-        if data is None:
-            print("not found")
-            continue
-
-        rows = read_csv_from_zip(data)
-        items = rows_to_metrics(rows, instrument)
-        if items:
-            catalog.write_data(items)
-            total += len(items)
-            print(f"{len(items):>8,} rows")
-        else:
-            print("empty")
+    total     = 0
+    kind      = f"{symbol}/metrics"
+    if manifest is not None:
+        date_strs = manifest.pending(kind, date_strs)
+    urls      = [
+        f"{BASE_URL}/metrics/{symbol}/{symbol}-metrics-{date_str}.zip"
+        for date_str in date_strs
+    ]
+    with CatalogBatchWriter(catalog, manifest) as writer:
+        for date_str, data in zip(date_strs, iter_downloads(urls)):
+            print(f"    [{date_str}] metrics  ...", end=" ", flush=True)
+            if data is None:
+                print("not found")
+                continue
+            if isinstance(data, requests.RequestException):
+                print(f"failed ({data})")
+                continue
+
+            table = read_csv_from_zip(data, METRICS_COLUMNS)
+            items = rows_to_metrics(table, instrument) if table is not None else []
+            if items:
+                writer.add(items, kind, date_str)
+                total += len(items)
+                print(f"{len(items):>8,} rows")
+            else:
+                print("empty")
 
     return total
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
+def fetch_symbol(
+    symbol: str,
+    dates: list[datetime],
+    intervals: list[str],
+    do_trades: bool,
+    do_bars: bool,
+    do_depth: bool,
+    do_metrics: bool,
+) -> None:
+    """Fetch every requested data type for one symbol into the catalog."""
+    catalog  = ParquetDataCatalog(
+        str(CATALOG_PATH), max_rows_per_group=CATALOG_ROW_GROUP_ROWS
+    )
+    manifest = FetchManifest(CATALOG_PATH / MANIFEST_NAME.format(symbol=symbol))
+
+    print(f"\n{'─' * 65}")
+    print(f"  {symbol}-PERP")
+    print(f"{'─' * 65}")
+
+    # Checked before this symbol writes anything; the flag sticks once the
+    # manifest is saved
+    if manifest.is_new and catalog_has_market_data(
+        CATALOG_PATH, get_instrument_id_str(symbol)
+    ):
+        manifest.per_day_files = True
+    if manifest.per_day_files:
+        print("  [!] Catalog predates the fetch manifest — writing one file per day")
+
+    date_strs  = [date.strftime("%Y-%m-%d") for date in dates]   # shared by every data type
+    instrument = build_instrument(symbol)
+    catalog.write_data([instrument])
+    print(f"  [✓] Instrument registered: {instrument.id}")
+
+    if do_trades:
+        print(f"\n  [1] aggTrades → TradeTick")
+        n = fetch_trades(symbol, date_strs, catalog, instrument, manifest)
+        print(f"      Total: {n:,} ticks")
+
+    if do_bars:
+        for i, interval in enumerate(intervals, start=2):
+            print(f"\n  [{i}] klines/{interval} → Bar")
+            n = fetch_bars(symbol, date_strs, interval, catalog, instrument, manifest)
+            print(f"      Total: {n:,} bars")
+
+    if do_depth:
+        print(f"\n  bookDepth → GenericData (BookDepthData)")
+        n = fetch_book_depth(symbol, date_strs, catalog, instrument, manifest)
+        print(f"      Total: {n:,} rows (~{n//12:,} snapshots)")
+
+    if do_metrics:
+        print(f"\n  metrics → GenericData (MarketMetrics)")
+        n = fetch_metrics(symbol, date_strs, catalog, instrument, manifest)
+        print(f"      Total: {n:,} rows")
+
+
+def _fetch_symbol_captured(symbol: str, *job) -> str:
+    """
+    Worker-process entry: run fetch_symbol and return its log as one block.
+    If it raises, the log up to the failure is returned with the traceback
+    appended, so the per-day lines still show where it stopped.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            fetch_symbol(symbol, *job)
+        except Exception as e:
+            print(f"\n  [ERROR] {symbol}: {e}")
+            traceback.print_exc(file=buf)
+    return buf.getvalue()
+
+
 def fetch(
     symbols: list[str],
     days: int = 30,
@@ -511,6 +944,7 @@ def fetch(
     no_depth: bool = False,
     no_metrics: bool = False,
     force: bool = False,
+    workers: int = 1,
 ) -> None:
     """
     Download all requested data for all symbols.
@@ -524,6 +958,8 @@ def fetch(
         no_depth   : if True, skip bookDepth
         no_metrics : if True, skip metrics
         force      : if True, clear entire catalog before downloading
+        workers    : symbols fetched concurrently, one process each; with
+                     more than 1, each symbol's log is printed when it ends
     """
     if intervals is None:
         intervals = [DEFAULT_INTERVAL]
@@ -545,50 +981,35 @@ def fetch(
 
     # Date range: yesterday back N days (today's data often not yet published)
     today = datetime.now(tz=timezone.utc).date()
-    dates = sorted([
-        datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
-        - timedelta(days=i)
-        for i in range(1, days + 1)
-    ])
-
-    catalog = ParquetDataCatalog(str(CATALOG_PATH))
+    start = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+    dates = [start - timedelta(days=i) for i in range(days, 0, -1)]   # oldest first
 
     # Determine which data types to fetch
     do_trades  = not bars_only
     do_bars    = not trades_only
     do_depth   = not trades_only and not bars_only and not no_depth
     do_metrics = not trades_only and not bars_only and not no_metrics
-
-    # ── Per-symbol fetch loop ────────────────────────────────────────────────
-    for symbol in symbols:
-        print(f"\n{'─' * 65}")
-        print(f"  {symbol}-PERP")
-        print(f"{'─' * 65}")
-
-        instrument = build_instrument(symbol)
-        catalog.write_data([instrument])
-        print(f"  [✓] Instrument registered: {instrument.id}")
-
-        if do_trades:
-            print(f"\n  [1] aggTrades → TradeTick")
-            n = fetch_trades(symbol, dates, catalog, instrument)
-            print(f"      Total: {n:,} ticks")
-
-        if do_bars:
-            for i, interval in enumerate(intervals, start=2):
-                print(f"\n  [{i}] klines/{interval} → Bar")
-                n = fetch_bars(symbol, dates, interval, catalog, instrument)
-                print(f"      Total: {n:,} bars")
-
-        if do_depth:
-            print(f"\n  bookDepth → GenericData (BookDepthData)")
-            n = fetch_book_depth(symbol, dates, catalog, instrument)
-            print(f"      Total: {n:,} rows (~{n//12:,} snapshots)")
-
-        if do_metrics:
-            print(f"\n  metrics → GenericData (MarketMetrics)")
-            n = fetch_metrics(symbol, dates, catalog, instrument)
-            print(f"      Total: {n:,} rows")
+    job = (dates, intervals, do_trades, do_bars, do_depth, do_metrics)
+
+    # ── Per-symbol fetch ─────────────────────────────────────────────────────
+    # Symbols share nothing (separate catalog partitions and manifests), so
+    # they can run in separate processes — parsing is CPU-bound Python.
+    workers = max(1, min(workers, len(symbols), os.cpu_count() or 1))
+    if workers == 1:
+        for symbol in symbols:
+            fetch_symbol(symbol, *job)
+    else:
+        print(f"\n  Fetching {len(symbols)} symbols with {workers} worker processes...")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_fetch_symbol_captured, symbol, *job): symbol
+                for symbol in symbols
+            }
+            for fut in as_completed(futures):
+                try:
+                    print(fut.result(), end="")
+                except Exception as e:
+                    print(f"\n  [ERROR] {futures[fut]}: {e}")
 
     # ── Summary ──────────────────────────────────────────────────────────────
     print(f"\n{'=' * 65}")
@@ -615,4 +1036,5 @@ if __name__ == "__main__":
         no_depth=args.no_depth,
         no_metrics=args.no_metrics,
         force=args.force,
+        workers=args.workers,
     )